@@ -178,16 +178,28 @@ class IPCClient:
         self.buffer_size = buffer_size
         self.pipe_handle: Optional[int] = None
         self.connected = False
+        self.server_pid: Optional[int] = None  # PID of the kernel owning the pipe
         self._message_handlers: Dict[str, Callable] = {}
         self._thread: Optional[threading.Thread] = None
         self._running = False
         self._outbound_queue: Queue = Queue()  # Queue for messages to send
+        self.on_disconnect: Optional[Callable[[], None]] = None  # Called from the listener thread
     
     def register_handler(self, message_type: str, handler: Callable):
         """Register a handler for a specific message type"""
         self._message_handlers[message_type] = handler
         logger.debug(f"Registered handler for message type: {message_type}")
     
+    def _mark_disconnected(self):
+        """Drop connection state; the server PID may be reused once the pipe is gone"""
+        self.connected = False
+        self.server_pid = None
+        if self.on_disconnect:
+            try:
+                self.on_disconnect()
+            except Exception as e:
+                logger.error(f"Disconnect handler error: {e}")
+    
     def connect(self, timeout_ms: int = 5000) -> bool:
         """Connect to the IPC server"""
         try:
@@ -213,6 +225,12 @@ class IPCClient:
                 None
             )
             
+            # Remember the server PID so the kernel can be stopped without a process scan
+            try:
+                self.server_pid = win32pipe.GetNamedPipeServerProcessId(self.pipe_handle)
+            except (pywintypes.error, AttributeError):
+                self.server_pid = None
+            
             self.connected = True
             
             # Start listening thread
@@ -231,7 +249,7 @@ class IPCClient:
     def disconnect(self):
         """Disconnect from server"""
         self._running = False
-        self.connected = False
+        self._mark_disconnected()
         if self._thread:
             self._thread.join(timeout=2.0)
         if self.pipe_handle:
@@ -265,7 +283,7 @@ class IPCClient:
                 except pywintypes.error as e:
                     if e.winerror == 109:  # ERROR_BROKEN_PIPE
                         logger.info("Connection to server lost")
-                        self.connected = False
+                        self._mark_disconnected()
                         break
                 
                 # Send queued outbound messages
@@ -277,7 +295,7 @@ class IPCClient:
                         logger.debug(f"Client sent message: {msg.get('type')}")
                     except Exception as e:
                         logger.error(f"Failed to send message: {e}")
-                        self.connected = False
+                        self._mark_disconnected()
                         break
                 
                 # Small sleep to avoid busy loop
@@ -285,7 +303,7 @@ class IPCClient:
                 
             except Exception as e:
                 logger.error(f"Listen error: {e}", exc_info=True)
-                self.connected = False
+                self._mark_disconnected()
                 break
     
     def _process_message(self, message: Dict[str, Any]):
@@ -19,6 +19,12 @@ from ui.window import ShellWindow
 from ui.speech import SpeechManager
 from ipc import IPCClient
 
+# libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 def get_resource_path(relative_path: str) -> str:
     """Get absolute path to resource, works for dev and PyInstaller"""
@@ -87,7 +93,7 @@ class EV3UIApplication(QObject):
         try:
             config_full_path = get_resource_path(config_path)
             with open(config_full_path, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=YamlLoader)
             return config
         except Exception as e:
             logger.error(f"Failed to load config: {e}")
@@ -140,6 +146,7 @@ class EV3UIApplication(QObject):
         # Register IPC handlers
         self.ipc_client.register_handler("state_update", self._handle_state_update)
         self.ipc_client.register_handler("llm_response", self._handle_llm_response)
+        self.ipc_client.on_disconnect = self._handle_disconnect
         
         # Connect to service
         self._connect_to_service()
@@ -153,6 +160,7 @@ class EV3UIApplication(QObject):
         # Try to connect
         if self.ipc_client.connect(timeout_ms=5000):
             logger.info("Connected to kernel")
+            self.window.kernel_pid = self.ipc_client.server_pid
         else:
             logger.warning("Failed to connect to kernel. UI will run in standalone mode.")
             logger.info("Start the kernel with: python main_service.py")
@@ -168,10 +176,16 @@ class EV3UIApplication(QObject):
             logger.debug("Retrying connection to kernel...")
             if self.ipc_client.connect(timeout_ms=1000):
                 logger.info("Connected to kernel")
+                self.window.kernel_pid = self.ipc_client.server_pid
                 self.retry_timer.stop()
         else:
             self.retry_timer.stop()
     
+    def _handle_disconnect(self):
+        """Forget the kernel PID once the pipe is gone so a reused PID is never killed"""
+        if self.window:
+            self.window.kernel_pid = None
+    
     def run(self):
         """Run the application"""
         logger.info("Starting E.V3 UI...")
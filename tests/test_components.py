@@ -127,6 +127,102 @@ def test_model_loader():
         return False
 
 
+def test_hotkey_parser():
+    """Test global hotkey string parsing"""
+    print("\nTesting hotkey parser...")
+    
+    try:
+        from ui.window.shell_window import parse_hotkey, MOD_ALT, MOD_CONTROL, MOD_SHIFT, MOD_NOREPEAT
+        
+        assert parse_hotkey("ctrl+alt+e") == (MOD_NOREPEAT | MOD_CONTROL | MOD_ALT, ord("E"))
+        print("  ✓ ctrl+alt+e")
+        
+        assert parse_hotkey(" Ctrl + ALT + E ") == parse_hotkey("ctrl+alt+e")
+        assert parse_hotkey("shift+F5") == (MOD_NOREPEAT | MOD_SHIFT, 0x74)
+        print("  ✓ Case and whitespace ignored")
+        
+        for combination in ("ctrl+alt+bogus", "ctrl+f25"):
+            try:
+                parse_hotkey(combination)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"{combination!r} should be rejected")
+        print("  ✓ Unknown keys rejected")
+        
+        try:
+            parse_hotkey("ctrl+alt")
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("modifier-only hotkey should be rejected")
+        print("  ✓ Modifier-only hotkey rejected")
+        
+        print("✓ Hotkey parser working")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Hotkey parser test failed: {e}")
+        return False
+
+
+def test_verify_exists():
+    """Test verify_system's cached path existence check"""
+    print("\nTesting verify_system.exists...")
+    
+    try:
+        import tempfile
+        from verify_system import exists
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "present.txt").write_text("x")
+            (root / "subdir").mkdir()
+            
+            assert exists(root / "present.txt")
+            assert exists(root / "subdir")
+            print("  ✓ Existing file and directory found")
+            
+            assert not exists(root / "absent.txt")
+            print("  ✓ Missing file reported")
+            
+            assert not exists(root / "no_such_dir" / "file.txt")
+            print("  ✓ Missing parent directory reported")
+        
+        print("✓ verify_system.exists working")
+        return True
+        
+    except Exception as e:
+        print(f"✗ verify_system.exists test failed: {e}")
+        return False
+
+
+def test_verify_importable():
+    """Test verify_system's import-free dependency probe"""
+    print("\nTesting verify_system.importable...")
+    
+    try:
+        from verify_system import importable
+        
+        assert importable("json")
+        print("  ✓ Already imported module found")
+        
+        was_loaded = "wave" in sys.modules
+        assert importable("wave")
+        assert was_loaded or "wave" not in sys.modules
+        print("  ✓ Unimported module found without importing it")
+        
+        assert not importable("ev3_no_such_module")
+        print("  ✓ Missing module reported")
+        
+        print("✓ verify_system.importable working")
+        return True
+        
+    except Exception as e:
+        print(f"✗ verify_system.importable test failed: {e}")
+        return False
+
+
 def main():
     """Run all tests"""
     print("=" * 50)
@@ -140,6 +236,9 @@ def main():
     results.append(("Configuration", test_config()))
     results.append(("State Machine", test_state_machine()))
     results.append(("Model Loader", test_model_loader()))
+    results.append(("Hotkey Parser", test_hotkey_parser()))
+    results.append(("Verify exists", test_verify_exists()))
+    results.append(("Verify importable", test_verify_importable()))
     
     print()
     print("=" * 50)
@@ -26,6 +26,12 @@ class AnimationController:
         self.is_breathing = config.get("ui", {}).get("animations", {}).get("idle_breathing", {}).get("enabled", True)
         self.is_blinking = config.get("ui", {}).get("animations", {}).get("eye_blinking", {}).get("enabled", True)
         
+        # Whether the model has anything for breathing/blinking to drive (fixed once loaded)
+        self.has_breathing_bones = any(
+            "chest" in bone.name.lower() or "spine" in bone.name.lower() for bone in model.bones
+        )
+        self.has_blink_shapes = "eye_blink_left" in model.blendshapes or "eye_blink_right" in model.blendshapes
+        
         # Breathing parameters
         self.breathing_speed = config.get("ui", {}).get("animations", {}).get("idle_breathing", {}).get("speed", 0.5)
         self.breathing_intensity = config.get("ui", {}).get("animations", {}).get("idle_breathing", {}).get("intensity", 0.3)
@@ -168,6 +174,15 @@ class AnimationController:
             self.current_state = state
             self.state_transition_time = self.time
     
+    def is_animating(self) -> bool:
+        """Whether any animation actually moves the model (False when fully at rest)"""
+        return (
+            (self.is_breathing and self.has_breathing_bones)
+            or (self.is_blinking and self.has_blink_shapes)
+            or self.is_currently_blinking
+            or self.current_state != "idle"
+        )
+    
     def play_gesture(self, gesture_name: str):
         """Play a specific gesture animation"""
         logger.info(f"Playing gesture: {gesture_name}")
@@ -59,8 +59,8 @@ class OpenGLRenderer(QOpenGLWidget):
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setStyleSheet("background: transparent;")
         
-        # Idle animation state
-        self.idle_animation_enabled = True
+        # Idle animation state (sway, breathing scale and head tracking)
+        self.idle_animation_enabled = self.config.get("ui", {}).get("animations", {}).get("idle_motion", {}).get("enabled", True)
         self.breathing_phase = 0.0
         
         # Ensure we capture all mouse events - don't make transparent for input
@@ -346,6 +346,13 @@ class OpenGLRenderer(QOpenGLWidget):
             self.model.position = np.array([x, y, z], dtype=np.float32)
             logger.debug(f"Model position set to: ({x}, {y}, {z})")
     
+    def set_model_position_np(self, position: np.ndarray):
+        """Set model position from a packed float32 (3,) buffer"""
+        if self.model:
+            # Copy in place so the model keeps its own contiguous buffer
+            self.model.position[:] = position
+            logger.debug(f"Model position set to: {tuple(position)}")
+    
     def mousePressEvent(self, event):
         """Handle mouse press for Blender-style controls"""
         self.last_mouse_pos = event.position().toPoint()
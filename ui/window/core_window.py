@@ -5,14 +5,30 @@ Interactive robot frame for selecting models and components
 
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                                 QFileDialog, QMessageBox, QGraphicsView, 
-                                QGraphicsScene, QGraphicsEllipseItem, QGraphicsTextItem, QLineEdit,
+                                QGraphicsScene, QGraphicsItem, QGraphicsEllipseItem, QGraphicsTextItem, QLineEdit,
                                 QGroupBox, QCheckBox, QPushButton, QComboBox)
-from PySide6.QtCore import Qt, QRectF, QPointF, Signal, QTimer, QPropertyAnimation, QEasingCurve, Property
-from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QPixmap, QFont, QPainterPath
+from PySide6.QtCore import Qt, QRectF, QPointF, Signal, Slot, QTimer, QPropertyAnimation, QEasingCurve, Property
+from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QPixmap, QImage, QFont, QPainterPath
 from PySide6.QtSvg import QSvgRenderer
+from typing import Optional
 from loguru import logger
 import os
 import sys
+import threading
+import yaml
+
+# libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+# Pillow (optional) - only needed for the EPS robot frame
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
 
 
 def get_resource_path(relative_path: str) -> str:
@@ -29,6 +45,11 @@ class SlidingToggle(QWidget):
     """iOS-style sliding toggle switch"""
     toggled = Signal(bool)
     
+    # Shared brushes - paintEvent runs every frame of the slide animation
+    _TRACK_ON_BRUSH = QBrush(QColor(100, 181, 246))  # Blue when on
+    _TRACK_OFF_BRUSH = QBrush(QColor(60, 60, 60))  # Dark gray when off
+    _CIRCLE_BRUSH = QBrush(QColor(255, 255, 255))
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(50, 24)
@@ -48,8 +69,11 @@ class SlidingToggle(QWidget):
     
     @circle_position.setter
     def circle_position(self, pos):
+        # Repaint only the band the knob moved through (+1px for antialiasing)
+        old = self._circle_position
         self._circle_position = pos
-        self.update()
+        x0 = min(old, pos) - 1
+        self.update(x0, 0, max(old, pos) + 21 - x0, 24)
     
     def setChecked(self, checked):
         if self._checked != checked:
@@ -63,6 +87,9 @@ class SlidingToggle(QWidget):
         start_pos = 2 if not self._checked else 28
         end_pos = 28 if self._checked else 2
         
+        # Track color flips with the state; animation frames only repaint the knob band
+        self.update()
+        
         self.animation.setStartValue(start_pos)
         self.animation.setEndValue(end_pos)
         self.animation.start()
@@ -78,17 +105,12 @@ class SlidingToggle(QWidget):
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Draw background track
-        if self._checked:
-            track_color = QColor(100, 181, 246)  # Blue when on
-        else:
-            track_color = QColor(60, 60, 60)  # Dark gray when off
-        
-        painter.setBrush(QBrush(track_color))
+        painter.setBrush(self._TRACK_ON_BRUSH if self._checked else self._TRACK_OFF_BRUSH)
         painter.setPen(Qt.NoPen)
         painter.drawRoundedRect(0, 0, 50, 24, 12, 12)
         
         # Draw sliding circle
-        painter.setBrush(QBrush(QColor(255, 255, 255)))
+        painter.setBrush(self._CIRCLE_BRUSH)
         painter.drawEllipse(self._circle_position, 2, 20, 20)
 
 
@@ -187,12 +209,80 @@ class ModulesWindow(QMainWindow):
         }
     }
     
+    # Flattened (id, x, y, w, h, tooltip, folder, filter) rows, unpacked once at import
+    COMPONENT_LIST = tuple(
+        (component_id, *data["rect"], data["tooltip"], data["folder"], tuple(data["filter"].split(";;")))
+        for component_id, data in COMPONENTS.items()
+    )
+    COMPONENTS_BY_ID = {row[0]: row for row in COMPONENT_LIST}
+    
+    # Robot frame image, probed and decoded once per process (see _load_frame_pixmap)
+    _frame_pixmap: Optional[QPixmap] = None
+    _frame_pixmap_resolved = False
+    
+    # Placeholder robot rasterized per device pixel ratio, shared across windows
+    _PLACEHOLDER_ORIGIN = (125, 15)
+    _placeholder_pixmaps: dict = {}
+    
+    # Set once the component/config directories exist (see _ensure_directories)
+    _directories_ready = False
+    
+    # Shared styling for the picker group boxes and their buttons (see _add_file_pickers)
+    _PICKERS_STYLE = """
+        QGroupBox {
+            font-size: 13px;
+            font-weight: bold;
+            color: #64B5F6;
+            border: 2px solid #444;
+            border-radius: 5px;
+            margin-top: 10px;
+            padding: 10px;
+        }
+        QGroupBox::title {
+            subcontrol-origin: margin;
+            left: 10px;
+            padding: 0 5px;
+        }
+        QPushButton {
+            background: #2a2a2a;
+            color: #64B5F6;
+            border: 1px solid #555;
+            padding: 8px;
+            border-radius: 3px;
+            text-align: left;
+        }
+        QPushButton:hover {
+            background: #3a3a3a;
+            border: 1px solid #64B5F6;
+        }
+        QPushButton:pressed {
+            background: #1a1a1a;
+        }
+    """
+    
+    # Emitted from the config writer thread: (config_file, new mtime or None, error message)
+    _config_written = Signal(str, object, str)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
         self.setWindowTitle("E.V3 Modules Configuration")
+        
+        # Parsed config.yaml, reused until the file changes on disk
+        self._config_cache: Optional[dict] = None
+        self._config_mtime: Optional[int] = None
+        
+        # Changes handed to the writer thread; None while no write is in flight
+        self._committing: Optional[dict] = None
+        self._config_written.connect(self._on_config_written)
+        
+        # Single file picker reused by every component/model selection
+        self._file_dialog: Optional[QFileDialog] = None
         self.setFixedSize(620, 700)
         
+        # Component folders and the config directory are fixed; create them up front
+        self._ensure_directories()
+        
         # Setup UI
         self._setup_ui()
         
@@ -201,6 +291,16 @@ class ModulesWindow(QMainWindow):
         
         logger.info("Modules window initialized")
     
+    @classmethod
+    def _ensure_directories(cls):
+        """Create the component folders and config directory once per process"""
+        if cls._directories_ready:
+            return
+        for folder in {row[6] for row in cls.COMPONENT_LIST}:
+            os.makedirs(folder, exist_ok=True)
+        os.makedirs(os.path.dirname(get_resource_path("config/config.yaml")), exist_ok=True)
+        cls._directories_ready = True
+    
     def _setup_ui(self):
         """Setup the UI"""
         central = QWidget()
@@ -230,16 +330,22 @@ class ModulesWindow(QMainWindow):
         
         # Graphics view for robot frame (left side, smaller)
         self.scene = QGraphicsScene()
+        # A handful of static items - linear lookup beats maintaining a BSP tree
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.view = QGraphicsView(self.scene)
-        self.view.setRenderHint(QPainter.Antialiasing)
         self.view.setStyleSheet("background: #2b2b2b; border: 2px solid #444;")
         self.view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.view.setFixedSize(280, 350)  # Narrower to avoid overlapping toggles
+        # Hover glows repaint only their own rect; the view draws without AA and
+        # every item sets its own pen/brush, so skip the AA margin and state saves
+        self.view.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        self.view.setOptimizationFlag(QGraphicsView.DontAdjustForAntialiasing, True)
+        self.view.setOptimizationFlag(QGraphicsView.DontSavePainterState, True)
         bottom_layout.addWidget(self.view)
         
-        # Draw robot frame
-        self._draw_robot_frame()
+        # Robot frame is drawn on first show (see showEvent)
+        self._scene_populated = False
         
         # Right side spacer for future toggles extension
         bottom_layout.addStretch()
@@ -252,6 +358,7 @@ class ModulesWindow(QMainWindow):
         terminal_layout.setContentsMargins(10, 5, 10, 5)
         
         self.commit_label = QLabel("commit_to_modules? (Y/N)")
+        # One stylesheet for every prompt state; switched via the "state" property
         self.commit_label.setStyleSheet("""
             QLabel {
                 font-family: 'Consolas', 'Courier New', monospace;
@@ -260,8 +367,16 @@ class ModulesWindow(QMainWindow):
                 padding: 5px;
                 background: #1a1a1a;
             }
+            QLabel[state="ok"] { color: #4CAF50; }
+            QLabel[state="warn"] { color: #FFA726; }
+            QLabel[state="err"] { color: #FF5252; }
         """)
         
+        # Single reset timer; restarting it debounces rapid commits/cancels
+        self._prompt_reset_timer = QTimer(self)
+        self._prompt_reset_timer.setSingleShot(True)
+        self._prompt_reset_timer.timeout.connect(self._reset_commit_prompt)
+        
         self.commit_input = QLineEdit()
         self.commit_input.setMaxLength(1)
         self.commit_input.setFixedWidth(30)
@@ -297,30 +412,20 @@ class ModulesWindow(QMainWindow):
     def _add_file_pickers(self, layout):
         """Add file picker buttons and module toggles in two-column layout"""
         
+        # One container carries the group box and button styling for every picker,
+        # so the stylesheet is parsed once instead of per widget
+        pickers = QWidget()
+        pickers.setStyleSheet(self._PICKERS_STYLE)
+        
         # Create horizontal layout for two columns
-        columns_layout = QHBoxLayout()
+        columns_layout = QHBoxLayout(pickers)
+        columns_layout.setContentsMargins(0, 0, 0, 0)
         
         # Left column - Model selection
         left_column = QVBoxLayout()
         
         # LLM Configuration Group
         llm_group = QGroupBox("🧠 AI Brain (LLM)")
-        llm_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 13px;
-                font-weight: bold;
-                color: #64B5F6;
-                border: 2px solid #444;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
         llm_layout = QVBoxLayout(llm_group)
         
         # Mode selector
@@ -346,13 +451,11 @@ class ModulesWindow(QMainWindow):
         
         # Fast model picker
         fast_btn = QPushButton("📁 Select Fast Model (Phi-3)")
-        fast_btn.setStyleSheet(self._button_style())
         fast_btn.clicked.connect(lambda: self._select_model("fast"))
         llm_layout.addWidget(fast_btn)
         
         # Deep model picker
         deep_btn = QPushButton("📁 Select Deep Model (Mistral)")
-        deep_btn.setStyleSheet(self._button_style())
         deep_btn.clicked.connect(lambda: self._select_model("deep"))
         llm_layout.addWidget(deep_btn)
         
@@ -360,11 +463,9 @@ class ModulesWindow(QMainWindow):
         
         # Character Model Group
         char_group = QGroupBox("💫 3D Character Model")
-        char_group.setStyleSheet(llm_group.styleSheet())
         char_layout = QVBoxLayout(char_group)
         
         char_btn = QPushButton("📁 Select Character Model (.vrm/.glb)")
-        char_btn.setStyleSheet(self._button_style())
         char_btn.clicked.connect(lambda: self._select_model("character"))
         char_layout.addWidget(char_btn)
         
@@ -376,11 +477,9 @@ class ModulesWindow(QMainWindow):
         
         # Speech Group
         speech_group = QGroupBox("🗣️ Speech (TTS)")
-        speech_group.setStyleSheet(llm_group.styleSheet())
         speech_layout = QVBoxLayout(speech_group)
         
         speech_btn = QPushButton("📁 Select Voice Model")
-        speech_btn.setStyleSheet(self._button_style())
         speech_btn.clicked.connect(lambda: self._select_model("speech"))
         speech_layout.addWidget(speech_btn)
         
@@ -388,11 +487,9 @@ class ModulesWindow(QMainWindow):
         
         # Hearing Group
         hearing_group = QGroupBox("👂 Hearing (STT)")
-        hearing_group.setStyleSheet(llm_group.styleSheet())
         hearing_layout = QVBoxLayout(hearing_group)
         
         hearing_btn = QPushButton("📁 Select Listening Model")
-        hearing_btn.setStyleSheet(self._button_style())
         hearing_btn.clicked.connect(lambda: self._select_model("hearing"))
         hearing_layout.addWidget(hearing_btn)
         
@@ -406,28 +503,12 @@ class ModulesWindow(QMainWindow):
         columns_layout.addLayout(left_column, 60)  # 60% width for left
         columns_layout.addLayout(right_column, 40)  # 40% width for right
         
-        layout.addLayout(columns_layout)
+        layout.addWidget(pickers)
     
     def _add_module_toggles(self, layout):
         """Add module enable/disable toggles"""
         
         modules_group = QGroupBox("⚙️ Module Toggles")
-        modules_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 13px;
-                font-weight: bold;
-                color: #64B5F6;
-                border: 2px solid #444;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
         modules_layout = QVBoxLayout(modules_group)
         
         # System Status Toggle with sliding switch
@@ -453,32 +534,13 @@ class ModulesWindow(QMainWindow):
         
         layout.addWidget(modules_group)
     
+    @Slot(bool)
     def _on_system_status_changed(self, enabled):
         """Handle system status toggle"""
         self.pending_changes["system_module_enabled"] = enabled
-        self.pending_changes["system_module_enabled"] = enabled
         logger.info(f"System module {'enabled' if enabled else 'disabled'}")
     
-    def _button_style(self):
-        """Return consistent button styling"""
-        return """
-            QPushButton {
-                background: #2a2a2a;
-                color: #64B5F6;
-                border: 1px solid #555;
-                padding: 8px;
-                border-radius: 3px;
-                text-align: left;
-            }
-            QPushButton:hover {
-                background: #3a3a3a;
-                border: 1px solid #64B5F6;
-            }
-            QPushButton:pressed {
-                background: #1a1a1a;
-            }
-        """
-    
+    @Slot(int)
     def _on_llm_mode_changed(self, index):
         """Handle LLM mode change"""
         mode = "fast" if index == 0 else "deep"
@@ -515,58 +577,62 @@ class ModulesWindow(QMainWindow):
         else:
             return
         
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            title,
-            folder,
-            filter_str
-        )
+        file_path = self._pick_file(title, folder, filter_str.split(";;"))
         
         if file_path:
             # Store just the filename
-            import os
             filename = os.path.basename(file_path)
             self.pending_changes[config_key] = filename
             logger.info(f"Selected {model_type} model: {filename}")
-            QMessageBox.information(
-                self,
-                "Model Selected",
-                f"{model_type.title()} model selected:\n{filename}\n\nType 'Y' in commit field to apply changes."
+            # Same non-modal prompt as component selection; 'Y' commits
+            self._set_commit_prompt(
+                f"{model_type.title()}: {filename} - commit_to_modules? (Y/N) [{len(self.pending_changes)} pending]",
+                "warn"
             )
     
     def _center_window(self):
         """Center window on screen"""
-        from PySide6.QtGui import QScreen
-        screen = QScreen.availableGeometry(self.screen())
-        x = (screen.width() - self.width()) // 2
-        y = (screen.height() - self.height()) // 2
-        self.move(x, y)
+        # Runs once per window; offset by the screen origin so secondary monitors center too
+        self.move(self.screen().availableGeometry().center() - self.rect().center())
     
-    def _draw_robot_frame(self):
-        """Draw the robot frame - simplified version until image is uploaded"""
-        # Try to load various image formats (check multiple case variations)
-        image_paths = [
-            # PNG (easiest, no dependencies)
-            get_resource_path("assets/Core_Frame.png"),
-            get_resource_path("assets/core_frame.png"),
-            # SVG
-            get_resource_path("assets/Core_Frame.svg"),
-            get_resource_path("assets/core_frame.svg"),
-            # EPS (requires Ghostscript)
-            get_resource_path("assets/Core_Frame.eps"),
-            get_resource_path("assets/core_frame.eps"),
-        ]
+    def showEvent(self, event):
+        """Build the robot scene the first time the window is shown"""
+        if not self._scene_populated:
+            self._scene_populated = True
+            # Let the window paint first; the frame image decode can be slow (EPS via Pillow)
+            QTimer.singleShot(0, self._draw_robot_frame)
+        super().showEvent(event)
+    
+    def closeEvent(self, event):
+        """Hide instead of close so the shell can reopen this instance"""
+        event.ignore()
+        self.hide()
+    
+    @classmethod
+    def _load_frame_pixmap(cls, dpr: float = 1.0) -> Optional[QPixmap]:
+        """Resolve the robot frame image once per process (None = draw placeholder)"""
+        if cls._frame_pixmap_resolved:
+            return cls._frame_pixmap
+        
+        # One directory read instead of a stat per candidate; names match case-insensitively
+        assets_dir = get_resource_path("assets")
+        try:
+            present = {entry.name.lower(): entry.name for entry in os.scandir(assets_dir)}
+        except FileNotFoundError:
+            present = {}
         
         pixmap = None
         
-        # Try each path
-        for img_path in image_paths:
-            if not os.path.exists(img_path):
-                logger.debug(f"Image path does not exist: {img_path}")
+        # Try each format: PNG (no dependencies), SVG, then EPS (requires Ghostscript)
+        for kind in ("png", "svg", "eps"):
+            name = present.get(f"core_frame.{kind}")
+            if name is None:
+                logger.debug(f"No core_frame.{kind} in {assets_dir}")
                 continue
-                
+            img_path = os.path.join(assets_dir, name)
+            
             try:
-                if img_path.endswith('.png'):
+                if kind == "png":
                     # Load PNG directly
                     pixmap = QPixmap(img_path)
                     if not pixmap.isNull():
@@ -575,10 +641,11 @@ class ModulesWindow(QMainWindow):
                         logger.info(f"Loaded PNG modules frame from {img_path}")
                         break
                 
-                elif img_path.endswith('.svg'):
-                    # Load SVG
+                elif kind == "svg":
+                    # Load SVG, rasterized at the display's pixel density so HiDPI stays crisp
                     renderer = QSvgRenderer(img_path)
-                    pixmap = QPixmap(480, 580)
+                    pixmap = QPixmap(int(480 * dpr), int(580 * dpr))
+                    pixmap.setDevicePixelRatio(dpr)
                     pixmap.fill(Qt.transparent)
                     
                     painter = QPainter(pixmap)
@@ -588,42 +655,111 @@ class ModulesWindow(QMainWindow):
                     logger.info(f"Loaded SVG modules frame from {img_path}")
                     break
                 
-                elif img_path.endswith('.eps'):
+                elif kind == "eps":
                     # Try to load EPS using Pillow (requires Ghostscript)
-                    from PIL import Image
+                    if not PIL_AVAILABLE:
+                        logger.warning(f"Pillow not installed, skipping {img_path}")
+                        continue
                     img = Image.open(img_path)
                     img = img.convert("RGBA")
                     
-                    # Convert PIL Image to QPixmap
-                    from io import BytesIO
-                    buffer = BytesIO()
-                    img.save(buffer, format='PNG')
-                    buffer.seek(0)
-                    
-                    pixmap = QPixmap()
-                    pixmap.loadFromData(buffer.read())
+                    # Hand the RGBA pixels straight to Qt - no PNG encode/decode round trip
+                    data = img.tobytes("raw", "RGBA")
+                    image = QImage(data, img.width, img.height, img.width * 4, QImage.Format_RGBA8888)
+                    pixmap = QPixmap.fromImage(image)
                     # Scale to reasonable size
                     pixmap = pixmap.scaled(480, 580, Qt.KeepAspectRatio, Qt.SmoothTransformation)
                     
                     logger.info(f"Loaded EPS modules frame from {img_path}")
                     break
                     
-            except ImportError as e:
-                logger.warning(f"Missing library for {img_path}: {e}")
             except Exception as e:
                 logger.error(f"Failed to load {img_path}: {e}")
         
+        cls._frame_pixmap = pixmap
+        cls._frame_pixmap_resolved = True
+        return pixmap
+    
+    @classmethod
+    def _placeholder_pixmap(cls, dpr: float) -> QPixmap:
+        """Rasterize the placeholder robot once per device pixel ratio"""
+        cached = cls._placeholder_pixmaps.get(dpr)
+        if cached is not None:
+            return cached
+        
+        # Colors
+        frame_color = QColor(100, 150, 200, 180)
+        pen = QPen(frame_color, 3)
+        brush = QBrush(QColor(50, 80, 120, 50))
+        
+        # All static body parts as one path (WindingFill so overlaps stay filled)
+        path = QPainterPath()
+        path.setFillRule(Qt.WindingFill)
+        path.addEllipse(200, 40, 100, 100)   # Head
+        path.addRect(240, 140, 20, 50)       # Neck
+        path.addRect(180, 190, 140, 180)     # Torso
+        path.addEllipse(150, 200, 40, 40)    # Left shoulder
+        path.addEllipse(310, 200, 40, 40)    # Right shoulder
+        path.addRect(130, 240, 30, 120)      # Left arm
+        path.addRect(340, 240, 30, 120)      # Right arm
+        path.addRect(200, 370, 35, 150)      # Left leg
+        path.addRect(265, 370, 35, 150)      # Right leg
+        
+        # Component labels with icons
+        labels = [
+            (230, 20, "🧠 LLM"),
+            (230, 155, "🗣️ Voice"),
+            (140, 75, "👂"),
+            (340, 75, "👁️"),
+            (230, 240, "❤️"),
+            (230, 300, "💾")
+        ]
+        
+        # Rasterize body and labels antialiased into a pixmap sized to the
+        # drawing so it doesn't grow the scene rect
+        origin_x, origin_y = cls._PLACEHOLDER_ORIGIN
+        frame_pixmap = QPixmap(int(260 * dpr), int(510 * dpr))
+        frame_pixmap.setDevicePixelRatio(dpr)
+        frame_pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(frame_pixmap)
+        painter.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing)
+        painter.translate(-origin_x, -origin_y)
+        painter.setPen(pen)
+        painter.setBrush(brush)
+        painter.drawPath(path)
+        
+        painter.setFont(QFont("Arial", 10))
+        painter.setPen(QColor(150, 200, 255))
+        for x, y, text in labels:
+            # +4 matches QGraphicsTextItem's default document margin
+            painter.drawText(QRectF(x + 4, y + 4, 120, 30), Qt.AlignLeft | Qt.AlignTop, text)
+        painter.end()
+        
+        cls._placeholder_pixmaps[dpr] = frame_pixmap
+        return frame_pixmap
+    
+    def _draw_robot_frame(self):
+        """Draw the robot frame - simplified version until image is uploaded"""
+        pixmap = self._load_frame_pixmap(self.view.devicePixelRatioF())
+        
         if pixmap:
             # Add pixmap and center it in the scene
             pixmap_item = self.scene.addPixmap(pixmap)
+            # Smooth filtering for the scaled image only - the view itself draws without AA
+            pixmap_item.setTransformationMode(Qt.SmoothTransformation)
+            # Keep the smooth-scaled result at device resolution so hover repaints
+            # blit it instead of resampling the source pixmap
+            pixmap_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
             
             # Scale down to 75% and shift up to show head
             pixmap_item.setScale(0.75)
             pixmap_item.setPos(-30, -120)
             
             # Set scene rect to accommodate the scaled and shifted image
-            scaled_width = pixmap.width() * 0.75
-            scaled_height = pixmap.height() * 0.75
+            size = pixmap.deviceIndependentSize()
+            scaled_width = size.width() * 0.75
+            scaled_height = size.height() * 0.75
             self.scene.setSceneRect(-30, -120, scaled_width, scaled_height)
             
             # Fit the view to show the entire scene
@@ -631,83 +767,47 @@ class ModulesWindow(QMainWindow):
         else:
             # Draw placeholder robot frame
             logger.info("Image not found, drawing placeholder robot")
+            frame_pixmap = self._placeholder_pixmap(self.view.devicePixelRatioF())
             
-            # Colors
-            frame_color = QColor(100, 150, 200, 180)
-            pen = QPen(frame_color, 3)
-            brush = QBrush(QColor(50, 80, 120, 50))
-            
-            # Head (circle)
-            head = self.scene.addEllipse(200, 40, 100, 100, pen, brush)
-            
-            # Neck
-            neck = self.scene.addRect(240, 140, 20, 50, pen, brush)
-            
-            # Torso (rounded rectangle)
-            torso = self.scene.addRect(180, 190, 140, 180, pen, brush)
-            
-            # Shoulders
-            left_shoulder = self.scene.addEllipse(150, 200, 40, 40, pen, brush)
-            right_shoulder = self.scene.addEllipse(310, 200, 40, 40, pen, brush)
-            
-            # Arms
-            left_arm = self.scene.addRect(130, 240, 30, 120, pen, brush)
-            right_arm = self.scene.addRect(340, 240, 30, 120, pen, brush)
-            
-            # Legs
-            left_leg = self.scene.addRect(200, 370, 35, 150, pen, brush)
-            right_leg = self.scene.addRect(265, 370, 35, 150, pen, brush)
-            
-            # Add labels
-            font = QFont("Arial", 10)
-            
-            # Component labels with icons
-            labels = [
-                (230, 20, "🧠 LLM"),
-                (230, 155, "🗣️ Voice"),
-                (140, 75, "👂"),
-                (340, 75, "👁️"),
-                (230, 240, "❤️"),
-                (230, 300, "💾")
-            ]
-            
-            for x, y, text in labels:
-                label = self.scene.addText(text, font)
-                label.setDefaultTextColor(QColor(150, 200, 255))
-                label.setPos(x, y)
+            frame_item = self.scene.addPixmap(frame_pixmap)
+            frame_item.setPos(*self._PLACEHOLDER_ORIGIN)
     
     def _add_clickable_regions(self):
         """Add clickable regions for each component"""
-        for component_id, component_data in self.COMPONENTS.items():
-            x, y, w, h = component_data["rect"]
-            tooltip = component_data["tooltip"]
-            
+        for component_id, x, y, w, h, tooltip, _folder, _filter in self.COMPONENT_LIST:
             # Create clickable region
             region = ClickableRegion(x, y, w, h, component_id, tooltip, self)
             self.scene.addItem(region)
             logger.debug(f"Added clickable region for {component_id} at ({x}, {y}, {w}, {h})")
     
+    def _read_config(self, config_file: str) -> dict:
+        """Parsed config.yaml, re-read only when its mtime changed"""
+        try:
+            mtime = os.stat(config_file).st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        if self._config_cache is None or mtime != self._config_mtime:
+            with open(config_file, 'r') as f:
+                self._config_cache = yaml.load(f, Loader=YamlLoader) or {}
+            self._config_mtime = mtime
+        return self._config_cache
+    
+    @Slot()
     def _handle_commit(self):
         """Handle Y/N commit input"""
         response = self.commit_input.text().upper()
         self.commit_input.clear()
         
         if response == 'Y':
-            if self.pending_changes:
+            if self._committing is not None:
+                logger.info("Configuration save already in progress")
+            elif self.pending_changes:
                 # Save to main config.yaml
-                import yaml
                 config_file = get_resource_path("config/config.yaml")
                 
                 try:
-                    # Ensure config directory exists
-                    os.makedirs(os.path.dirname(config_file), exist_ok=True)
-                    
                     # Load existing config
-                    if os.path.exists(config_file):
-                        with open(config_file, 'r') as f:
-                            config = yaml.safe_load(f) or {}
-                    else:
-                        config = {}
+                    config = self._read_config(config_file)
                     
                     # Update LLM settings
                     if "llm_mode" in self.pending_changes:
@@ -742,46 +842,19 @@ class ModulesWindow(QMainWindow):
                             config["modules"] = {}
                         config["modules"]["system_enabled"] = self.pending_changes["system_module_enabled"]
                     
-                    # Save updated config
-                    with open(config_file, 'w') as f:
-                        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
-                    
-                    self.commit_label.setText(f"✓ Committed {len(self.pending_changes)} change(s)")
-                    self.commit_label.setStyleSheet("""
-                        QLabel {
-                            font-family: 'Consolas', 'Courier New', monospace;
-                            font-size: 11px;
-                            color: #4CAF50;
-                            padding: 5px;
-                            background: #1a1a1a;
-                        }
-                    """)
-                    
-                    # Show success message
-                    QMessageBox.information(
-                        self,
-                        "Configuration Saved",
-                        f"Changes saved to {config_file}\n\nRestart E.V3 to apply changes."
-                    )
-                    
-                    # Clear pending changes
-                    self.pending_changes = {}
-                    
-                    # Reset label after delay
-                    QTimer.singleShot(3000, lambda: self.commit_label.setText("commit_to_modules? (Y/N)"))
-                    QTimer.singleShot(3000, lambda: self.commit_label.setStyleSheet("""
-                        QLabel {
-                            font-family: 'Consolas', 'Courier New', monospace;
-                            font-size: 11px;
-                            color: #64B5F6;
-                            padding: 5px;
-                            background: #1a1a1a;
-                        }
-                    """))
-                    
-                    logger.info("Module configuration committed successfully")
+                    # Serialize here, write and fsync off the GUI thread
+                    text = yaml.dump(config, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
+                    self._config_cache = config
+                    self._committing = dict(self.pending_changes)
+                    threading.Thread(
+                        target=self._write_config,
+                        args=(config_file, text),
+                        daemon=True
+                    ).start()
                 
                 except Exception as e:
+                    # The cached dict may hold unsaved edits - re-read next time
+                    self._config_cache = None
                     logger.error(f"Failed to save configuration: {e}", exc_info=True)
                     QMessageBox.critical(
                         self,
@@ -789,38 +862,87 @@ class ModulesWindow(QMainWindow):
                         f"Failed to save configuration:\n{str(e)}"
                     )
             else:
-                self.commit_label.setText("⚠ No pending changes")
-                QTimer.singleShot(2000, lambda: self.commit_label.setText("commit_to_modules? (Y/N)"))
+                self._set_commit_prompt("⚠ No pending changes")
+                self._prompt_reset_timer.start(2000)
         
         elif response == 'N':
             # Cancel pending changes
             if self.pending_changes:
-                self.commit_label.setText(f"✗ Cancelled {len(self.pending_changes)} change(s)")
-                self.commit_label.setStyleSheet("""
-                    QLabel {
-                        font-family: 'Consolas', 'Courier New', monospace;
-                        font-size: 11px;
-                        color: #FF5252;
-                        padding: 5px;
-                        background: #1a1a1a;
-                    }
-                """)
+                self._set_commit_prompt(f"✗ Cancelled {len(self.pending_changes)} change(s)", "err")
                 self.pending_changes = {}
                 
                 # Reset after 2 seconds
-                QTimer.singleShot(2000, lambda: self.commit_label.setText("commit_to_modules? (Y/N)"))
-                QTimer.singleShot(2000, lambda: self.commit_label.setStyleSheet("""
-                    QLabel {
-                        font-family: 'Consolas', 'Courier New', monospace;
-                        font-size: 11px;
-                        color: #64B5F6;
-                        padding: 5px;
-                        background: #1a1a1a;
-                    }
-                """))
+                self._prompt_reset_timer.start(2000)
             else:
-                self.commit_label.setText("⚠ No pending changes")
-                QTimer.singleShot(2000, lambda: self.commit_label.setText("commit_to_modules? (Y/N)"))
+                self._set_commit_prompt("⚠ No pending changes")
+                self._prompt_reset_timer.start(2000)
+    
+    def _write_config(self, config_file: str, text: str):
+        """Atomically replace config.yaml with text (runs off the GUI thread)"""
+        tmp_file = config_file + ".tmp"
+        try:
+            with open(tmp_file, 'w') as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, config_file)
+            self._config_written.emit(config_file, os.stat(config_file).st_mtime_ns, "")
+        except Exception as e:
+            logger.error(f"Failed to save configuration: {e}", exc_info=True)
+            self._config_written.emit(config_file, None, str(e))
+    
+    @Slot(str, object, str)
+    def _on_config_written(self, config_file: str, mtime, error: str):
+        """Report a finished config write and drop the committed changes"""
+        committed, self._committing = self._committing or {}, None
+        
+        if error:
+            # The cached dict holds unsaved edits - re-read next time
+            self._config_cache = None
+            QMessageBox.critical(
+                self,
+                "Save Failed",
+                f"Failed to save configuration:\n{error}"
+            )
+            return
+        
+        self._config_mtime = mtime
+        
+        # Keep anything selected while the write was in flight
+        for key, value in committed.items():
+            if self.pending_changes.get(key) == value:
+                del self.pending_changes[key]
+        
+        self._set_commit_prompt(f"✓ Committed {len(committed)} change(s)", "ok")
+        
+        # Show success message
+        QMessageBox.information(
+            self,
+            "Configuration Saved",
+            f"Changes saved to {config_file}\n\nRestart E.V3 to apply changes."
+        )
+        
+        # Reset label after delay
+        self._prompt_reset_timer.start(3000)
+        
+        logger.info("Module configuration committed successfully")
+    
+    def _set_commit_prompt(self, text: str, state: str = ""):
+        """Update the commit prompt text and its color state"""
+        # A newer prompt supersedes any pending reset
+        self._prompt_reset_timer.stop()
+        label = self.commit_label
+        label.setText(text)
+        if label.property("state") != state:
+            label.setProperty("state", state)
+            # Re-evaluate the [state=...] selectors without reparsing the stylesheet
+            label.style().unpolish(label)
+            label.style().polish(label)
+    
+    @Slot()
+    def _reset_commit_prompt(self):
+        """Restore the idle commit prompt"""
+        self._set_commit_prompt("commit_to_modules? (Y/N)")
     
     def _handle_component_click(self, component_type: str):
         """Handle click on robot frame component (not implemented yet)"""
@@ -829,32 +951,43 @@ class ModulesWindow(QMainWindow):
     
     def select_component(self, component_type: str):
         """Open file picker for component selection"""
-        if component_type not in self.COMPONENTS:
+        row = self.COMPONENTS_BY_ID.get(component_type)
+        if row is None:
             logger.error(f"Unknown component type: {component_type}")
             return
         
-        component = self.COMPONENTS[component_type]
-        folder = component["folder"]
-        file_filter = component["filter"]
+        folder, name_filters = row[6], row[7]
         
         logger.info(f"Selecting {component_type} from {folder}")
         
-        # Ensure folder exists
-        os.makedirs(folder, exist_ok=True)
-        
         # Open file dialog
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            f"Select {component_type.title()} Model",
-            folder,
-            file_filter
-        )
+        file_path = self._pick_file(f"Select {component_type.title()} Model", folder, name_filters)
         
         if file_path:
             self._apply_component_selection(component_type, file_path)
     
+    def _pick_file(self, title: str, folder: str, name_filters) -> str:
+        """Run the shared file dialog; returns the chosen path or an empty string"""
+        dialog = self._file_dialog
+        if dialog is None:
+            dialog = self._file_dialog = QFileDialog(self)
+            dialog.setFileMode(QFileDialog.ExistingFile)
+        
+        dialog.setWindowTitle(title)
+        dialog.setDirectory(folder)
+        dialog.setNameFilters(list(name_filters))
+        
+        if dialog.exec():
+            return dialog.selectedFiles()[0]
+        return ""
+    
     def _apply_component_selection(self, component_type: str, file_path: str):
         """Apply the selected component"""
+        # Re-picking the file that's already pending changes nothing
+        pending = self.pending_changes.get(component_type)
+        if pending is not None and pending["path"] == file_path:
+            return
+        
         logger.info(f"Selected {component_type}: {file_path}")
         
         # Add to pending changes
@@ -864,13 +997,4 @@ class ModulesWindow(QMainWindow):
         }
         
         # Update commit prompt
-        self.commit_label.setText(f"commit_to_modules? (Y/N) [{len(self.pending_changes)} pending]")
-        self.commit_label.setStyleSheet("""
-            QLabel {
-                font-family: 'Consolas', 'Courier New', monospace;
-                font-size: 11px;
-                color: #FFA726;
-                padding: 5px;
-                background: #1a1a1a;
-            }
-        """)
+        self._set_commit_prompt(f"commit_to_modules? (Y/N) [{len(self.pending_changes)} pending]", "warn")
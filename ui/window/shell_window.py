@@ -5,19 +5,140 @@ Frameless, always-on-top window with 3D character and system tray control
 
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                                QSystemTrayIcon, QMenu, QApplication, QLineEdit, QPushButton,
-                               QFrame, QDialog)
-from PySide6.QtCore import Qt, QPoint, QTimer, Signal
-from PySide6.QtGui import QScreen, QIcon, QAction, QKeySequence, QShortcut
+                               QFrame, QDialog, QTextEdit, QStyle, QFileDialog, QMessageBox)
+from PySide6.QtCore import (Qt, QPoint, QRect, QTimer, Signal, Slot, QAbstractNativeEventFilter, QProcess,
+                            QElapsedTimer, QSignalMapper)
+from PySide6.QtGui import (QScreen, QIcon, QAction, QKeySequence, QShortcut, QTextCursor, QTextBlockFormat,
+                           QPixmap, QPainter)
+from PySide6.QtSvg import QSvgRenderer
 from typing import Dict, Any, Optional
 from loguru import logger
+import os
 import sys
-import keyboard
+import ctypes
+import ctypes.wintypes
+import threading
+import numpy as np
+import yaml
+
+# libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+# Writable config location (AppData on Windows, not bundled _internal)
+PERMISSIONS_DIR = os.path.join(os.getenv('APPDATA', '.'), 'E.V3', 'config')
+PERMISSIONS_FILE = os.path.join(PERMISSIONS_DIR, "permissions.yaml")
 
 from ui.renderer import OpenGLRenderer
 from ui.animations import AnimationController
 from ui.window.core_window import ModulesWindow
 
 
+# Secure permission defaults; copy with a fresh allowed_folders set before mutating
+_DEFAULT_PERMISSIONS = {
+    "filesystem": "scoped",
+    "network": "local",
+    "sysinfo": "basic",
+    "calendar": "read",
+    "llm": "local",
+    "llm_logging": False,
+    "allowed_folders": frozenset(),
+}
+
+# Win32 RegisterHotKey constants
+WM_HOTKEY = 0x0312
+MOD_ALT = 0x0001
+MOD_CONTROL = 0x0002
+MOD_SHIFT = 0x0004
+MOD_WIN = 0x0008
+MOD_NOREPEAT = 0x4000
+HOTKEY_ID = 1
+
+# Win+<letter> shortcuts are largely reserved by the shell (Win+C is Copilot/Chat)
+DEFAULT_HOTKEY = "ctrl+alt+e"
+
+_HOTKEY_MODIFIERS = {
+    "alt": MOD_ALT,
+    "ctrl": MOD_CONTROL,
+    "control": MOD_CONTROL,
+    "shift": MOD_SHIFT,
+    "win": MOD_WIN,
+    "windows": MOD_WIN,
+}
+
+_HOTKEY_NAMED_KEYS = {
+    "space": 0x20,
+    "enter": 0x0D,
+    "tab": 0x09,
+    "esc": 0x1B,
+    "escape": 0x1B,
+}
+
+# OpenProcess access rights for stopping the kernel
+PROCESS_TERMINATE = 0x0001
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+
+# Private kernel32 instance so these prototypes don't leak into other ctypes users
+if sys.platform == "win32":
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.OpenProcess.argtypes = [ctypes.wintypes.DWORD, ctypes.wintypes.BOOL, ctypes.wintypes.DWORD]
+    _kernel32.OpenProcess.restype = ctypes.wintypes.HANDLE
+    _kernel32.QueryFullProcessImageNameW.argtypes = [
+        ctypes.wintypes.HANDLE, ctypes.wintypes.DWORD, ctypes.wintypes.LPWSTR,
+        ctypes.POINTER(ctypes.wintypes.DWORD)
+    ]
+    _kernel32.QueryFullProcessImageNameW.restype = ctypes.wintypes.BOOL
+    _kernel32.TerminateProcess.argtypes = [ctypes.wintypes.HANDLE, ctypes.wintypes.UINT]
+    _kernel32.TerminateProcess.restype = ctypes.wintypes.BOOL
+    _kernel32.CloseHandle.argtypes = [ctypes.wintypes.HANDLE]
+    _kernel32.CloseHandle.restype = ctypes.wintypes.BOOL
+else:
+    _kernel32 = None
+
+
+def parse_hotkey(combination: str) -> tuple:
+    """Parse a hotkey string like 'ctrl+alt+e' into (modifiers, virtual key code)"""
+    modifiers = MOD_NOREPEAT
+    vk = None
+    for part in combination.lower().replace(" ", "").split("+"):
+        if part in _HOTKEY_MODIFIERS:
+            modifiers |= _HOTKEY_MODIFIERS[part]
+        elif part in _HOTKEY_NAMED_KEYS:
+            vk = _HOTKEY_NAMED_KEYS[part]
+        elif len(part) == 1 and part.isalnum():
+            vk = ord(part.upper())
+        elif part.startswith("f") and part[1:].isdigit() and 1 <= int(part[1:]) <= 24:
+            vk = 0x70 + int(part[1:]) - 1  # VK_F1..VK_F24
+        else:
+            raise ValueError(f"Unsupported hotkey key: {part!r}")
+    if vk is None:
+        raise ValueError(f"Hotkey has no key: {combination!r}")
+    return modifiers, vk
+
+
+class _HotkeyEventFilter(QAbstractNativeEventFilter):
+    """
+    Catches WM_HOTKEY from the GUI thread's message queue
+    
+    The hotkey is registered without a window handle because setWindowFlags()
+    recreates the shell's HWND whenever click-through is toggled.
+    """
+    
+    def __init__(self, callback):
+        super().__init__()
+        self._callback = callback
+    
+    def nativeEventFilter(self, event_type, message):
+        if bytes(event_type) == b"windows_generic_MSG":
+            msg = ctypes.wintypes.MSG.from_address(int(message))
+            if msg.message == WM_HOTKEY and msg.wParam == HOTKEY_ID:
+                self._callback()
+                return True, 0
+        return False, 0
+
+
 class ShellWindow(QMainWindow):
     """
     Main shell window
@@ -31,6 +152,30 @@ class ShellWindow(QMainWindow):
     # Signal to safely invoke hotkey actions on GUI thread
     hotkey_triggered = Signal()
     
+    # Message overlay stylesheet (parsed by Qt once per setStyleSheet call)
+    _MESSAGE_QSS = """
+        QLabel {
+            color: white;
+            background: rgba(0, 0, 0, 150);
+            border-radius: 10px;
+            padding: 10px;
+            font-size: 14px;
+            font-family: 'Segoe UI', Arial, sans-serif;
+        }
+    """
+    
+    # Tray notification label for each permission category
+    _PERMISSION_LABELS = {
+        "filesystem": "File system access",
+        "network": "Network access",
+        "sysinfo": "System info access",
+        "calendar": "Calendar access",
+        "llm": "LLM mode",
+    }
+    
+    # Tray icon resolved once per process and shared by every ShellWindow
+    _TRAY_ICON: Optional[QIcon] = None
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__()
         
@@ -38,11 +183,60 @@ class ShellWindow(QMainWindow):
         self.is_click_through = False  # Start non-click-through so it's controllable
         self.current_state = "idle"
         self.chat_window = None
-        self.hotkey_enabled = True
-        self.hotkey_combination = "win+c"  # Default hotkey
-        
-        # Connect hotkey signal to handler (ensures GUI thread execution)
-        self.hotkey_triggered.connect(self._handle_hotkey_on_gui_thread)
+        self.core_window: Optional[ModulesWindow] = None  # Built on first open, then reused
+        hotkey_config = config.get("ui", {}).get("hotkey", {})
+        self.hotkey_enabled = hotkey_config.get("enabled", True)
+        self.hotkey_combination = hotkey_config.get("combination", DEFAULT_HOTKEY)
+        self._hotkey_filter: Optional[_HotkeyEventFilter] = None  # Installed while the hotkey is registered
+        self.kernel_pid: Optional[int] = None  # Set by main_ui once IPC connects
+        self._ipc_send_callback = None  # Hooked up by main_ui
+        self._permissions_write_lock = threading.Lock()  # Serializes background saves
+        self._permissions_save_seq = 0  # Latest snapshot issued
+        self._permissions_written_seq = 0  # Latest snapshot on disk
+        
+        # Bursts of permission changes are written to disk and sent to the kernel once
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._save_permissions_now)
+        
+        # Set in _create_ui when a model is loaded
+        self.animation_controller: Optional[AnimationController] = None
+        self._anim_clock: Optional[QElapsedTimer] = None  # Real dt between presented frames
+        self._anim_running = False
+        self._at_rest = False  # Idle with nothing moving - renderer timer stays stopped
+        
+        # (x, y) offset from window top-left to the cursor while dragging
+        self.drag_position: Optional[tuple] = None
+        
+        # Window drag coalescing - at most one move() per event loop pass
+        self._pending_move: Optional[tuple] = None
+        self._move_scheduled = False
+        
+        # Pending click-through change (None = nothing scheduled)
+        self._pending_click_through: Optional[bool] = None
+        
+        # Last (state, intensity, color) glow sent to the renderer
+        self._last_glow: Optional[tuple] = None
+        
+        # Single reusable auto-hide timer for non-critical messages
+        self._msg_hide_timer = QTimer(self)
+        self._msg_hide_timer.setSingleShot(True)
+        self._msg_hide_timer.timeout.connect(self.hide_message)
+        
+        # Model transform changes are pushed to the renderer once per event loop pass
+        self._scale_dirty = False
+        self._position_dirty = False
+        self._xform_timer = QTimer(self)
+        self._xform_timer.setSingleShot(True)
+        self._xform_timer.setInterval(0)
+        self._xform_timer.timeout.connect(self._flush_xform)
+        
+        # Connect hotkey signal to handler (queued, so it always runs on the GUI thread)
+        self.hotkey_triggered.connect(self._handle_hotkey_on_gui_thread, Qt.QueuedConnection)
+        
+        # Resolve nested config values once
+        self._load_config_cache()
         
         # Setup window properties
         self._setup_window()
@@ -53,14 +247,44 @@ class ShellWindow(QMainWindow):
         # Setup system tray
         self._setup_tray_icon()
         
+        # Cache screen geometry; refreshed only when the screen reports a change
+        self._tracked_screen: Optional[QScreen] = None
+        self._screen_changed_connected = False
+        self._reposition_scheduled = False
+        self._track_screen(self.screen())
+        
         # Position window
         self._position_window()
         
-        # Setup global hotkey
-        self._setup_global_hotkey()
+        # Setup global hotkey once the event loop is running, so the window paints first
+        QTimer.singleShot(0, self._setup_global_hotkey)
+        
+        # Build the chat window once startup has settled so the first summon is instant
+        QTimer.singleShot(2000, self._prewarm_chat)
         
         logger.info("Shell window initialized")
     
+    def _load_config_cache(self):
+        """Resolve nested UI config values once instead of on every state change"""
+        ui_config = self.config.get("ui", {})
+        window_config = ui_config.get("window", {})
+        glow_config = ui_config.get("animations", {}).get("glow", {})
+        
+        self._window_width = window_config.get("width", 300)
+        self._window_height = window_config.get("height", 450)
+        self._offset_x = window_config.get("offset_x", 20)
+        self._offset_y = window_config.get("offset_y", 20)
+        self._click_through_when_idle = window_config.get("click_through_when_idle", True)
+        
+        self._glow_enabled = glow_config.get("enabled", True)
+        self._glow_color_tuple = tuple(glow_config.get("color", [0.3, 0.6, 1.0]))
+        self._glow_intensity = glow_config.get("intensity", 0.5)
+        
+        # state -> (base intensity, color, priority scale); a scale of 0 means fixed intensity
+        self._state_effects = {"reminder": (0.3, (0.5, 0.8, 0.3), 0.0)}
+        if self._glow_enabled:
+            self._state_effects["alert"] = (self._glow_intensity, self._glow_color_tuple, 0.3)
+    
     def _setup_window(self):
         """Setup window flags and properties"""
         # Frameless window with click-through for transparent areas
@@ -71,15 +295,17 @@ class ShellWindow(QMainWindow):
             Qt.WindowTransparentForInput  # Allow clicks to pass through transparent areas
         )
         
+        # Precompute the two flag sets used by the interaction toggles
+        self._base_flags = self.windowFlags()
+        self._interactive_flags = self._base_flags & ~Qt.WindowTransparentForInput
+        self._click_through_flags = self._base_flags | Qt.WindowTransparentForInput
+        
         # Transparent background
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setAttribute(Qt.WA_NoSystemBackground)
         
         # Window size - smaller and locked
-        ui_config = self.config.get("ui", {}).get("window", {})
-        width = ui_config.get("width", 300)
-        height = ui_config.get("height", 450)
-        self.setFixedSize(width, height)
+        self.setFixedSize(self._window_width, self._window_height)
         
         # Lock window in place (disable dragging by default)
         self.window_locked = True
@@ -104,22 +330,17 @@ class ShellWindow(QMainWindow):
         self.renderer = OpenGLRenderer(config=self.config)
         layout.addWidget(self.renderer, stretch=1)
         
-        # Text overlay (for messages)
-        self.message_label = QLabel("")
-        self.message_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                background: rgba(0, 0, 0, 150);
-                border-radius: 10px;
-                padding: 10px;
-                font-size: 14px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-        """)
+        # Resolve optional renderer transform setters once
+        self._set_scale = getattr(self.renderer, 'set_model_scale', None)
+        self._set_pos = getattr(self.renderer, 'set_model_position_np', None)
+        
+        # Text overlay (for messages) - manually placed over the renderer's bottom edge,
+        # never in the layout, so showing/hiding it doesn't trigger a relayout
+        self.message_label = QLabel("", central)
+        self.message_label.setStyleSheet(ShellWindow._MESSAGE_QSS)
         self.message_label.setAlignment(Qt.AlignCenter)
         self.message_label.setWordWrap(True)
         self.message_label.hide()
-        layout.addWidget(self.message_label)
         
         # Animation controller
         if self.renderer.model:
@@ -128,17 +349,46 @@ class ShellWindow(QMainWindow):
                 self.config
             )
             
-            # Update animations
-            self.anim_timer = QTimer(self)
-            self.anim_timer.timeout.connect(self._update_animations)
-            self.anim_timer.start(16)  # ~60 FPS
+            # Advance animations once per presented frame - gated by showEvent/hideEvent
+            self._anim_clock = QElapsedTimer()
+            self.renderer.frameSwapped.connect(self._update_animations)
+    
+    def _start_animation(self):
+        """Resume animation ticks and renderer repaints"""
+        if self._anim_clock is not None and not self._anim_running:
+            self._anim_running = True
+            self._anim_clock.start()
+        if not self.renderer.timer.isActive():
+            self.renderer.timer.start()
+    
+    def _stop_animation(self):
+        """Pause animation ticks and renderer repaints (nothing visible to draw)"""
+        self._anim_running = False
+        self.renderer.timer.stop()
+    
+    def _is_on_screen(self) -> bool:
+        """Whether the shell is actually presented (isVisible stays True while minimized)"""
+        return self.isVisible() and not self.isMinimized()
+    
+    def showEvent(self, event):
+        """Resume animations when the window becomes visible"""
+        super().showEvent(event)
+        if not self._at_rest:
+            self._start_animation()
+        
+        # The QWindow only exists once shown; follow it if it's dragged to another monitor
+        if not self._screen_changed_connected:
+            self._screen_changed_connected = True
+            self.windowHandle().screenChanged.connect(self._track_screen)
+    
+    def hideEvent(self, event):
+        """Pause animations while hidden (e.g. minimized to tray)"""
+        super().hideEvent(event)
+        self._stop_animation()
     
     def _setup_tray_icon(self):
         """Setup system tray icon with menu"""
         self.tray_icon = QSystemTrayIcon(self)
-        import os
-        import sys
-        from PySide6.QtGui import QIcon
 
         # Helper for PyInstaller compatibility
         def get_resource_path(relative_path: str) -> str:
@@ -148,15 +398,36 @@ class ShellWindow(QMainWindow):
                 base_path = os.path.abspath(".")
             return os.path.join(base_path, relative_path)
 
-        # Prefer user-provided ICO in assets/, fall back to standard icon
-        icon_path = get_resource_path(os.path.join("assets", "E.V3.ico"))
-        if os.path.exists(icon_path):
-            icon = QIcon(icon_path)
-        else:
-            from PySide6.QtWidgets import QStyle
-            icon = self.style().standardIcon(QStyle.StandardPixmap.SP_ComputerIcon)
+        if ShellWindow._TRAY_ICON is None:
+            # Prefer user-provided ICO in assets/, then SVG, fall back to standard icon
+            icon_path = get_resource_path(os.path.join("assets", "E.V3.ico"))
+            svg_path = get_resource_path(os.path.join("assets", "E.V3.svg"))
+            if os.path.exists(icon_path):
+                icon = QIcon(icon_path)
+            elif os.path.exists(svg_path):
+                # Rasterize the SVG once so tray repaints never re-render it
+                pixmap = QPixmap(256, 256)
+                pixmap.fill(Qt.transparent)
+                painter = QPainter(pixmap)
+                QSvgRenderer(svg_path).render(painter)
+                painter.end()
+                icon = QIcon(pixmap)
+            else:
+                icon = self.style().standardIcon(QStyle.StandardPixmap.SP_ComputerIcon)
+            ShellWindow._TRAY_ICON = icon
 
-        self.tray_icon.setIcon(icon)
+        self.tray_icon.setIcon(ShellWindow._TRAY_ICON)
+        
+        # Submenus are populated on first show; builders register their actions here
+        self._built_menus = set()
+        self._input_mode_actions = {}
+        self._output_mode_actions = {}
+        self._perm_actions = {}  # category -> {level: action}
+        self.llm_log_action = None
+        
+        # Mode/permission actions are mapped to "kind:value" keys instead of per-action lambdas
+        self._action_mapper = QSignalMapper(self)
+        self._action_mapper.mappedString.connect(self._dispatch_menu_action)
         
         # Create main menu (parent it to self)
         tray_menu = QMenu(self)
@@ -174,33 +445,11 @@ class ShellWindow(QMainWindow):
         # 3D Model Controls removed - use Manipulate Model toggle instead
         
         # Input Mode submenu
-        input_menu = QMenu("Input Mode", shell_menu)
-        
-        self.input_text_action = QAction("Text", self, checkable=True)
-        self.input_text_action.setChecked(True)
-        self.input_text_action.triggered.connect(lambda: self.set_input_mode("text"))
-        input_menu.addAction(self.input_text_action)
-        
-        self.input_voice_action = QAction("Voice (Coming Soon)", self, checkable=True)
-        self.input_voice_action.setEnabled(False)
-        self.input_voice_action.triggered.connect(lambda: self.set_input_mode("voice"))
-        input_menu.addAction(self.input_voice_action)
-        
+        input_menu = self._lazy_menu("Input Mode", shell_menu, "input", self._build_input_menu)
         shell_menu.addMenu(input_menu)
         
         # Output Mode submenu
-        output_menu = QMenu("Output Mode", shell_menu)
-        
-        self.output_text_action = QAction("Text", self, checkable=True)
-        self.output_text_action.setChecked(True)
-        self.output_text_action.triggered.connect(lambda: self.set_output_mode("text"))
-        output_menu.addAction(self.output_text_action)
-        
-        self.output_voice_action = QAction("Voice (Coming Soon)", self, checkable=True)
-        self.output_voice_action.setEnabled(False)
-        self.output_voice_action.triggered.connect(lambda: self.set_output_mode("voice"))
-        output_menu.addAction(self.output_voice_action)
-        
+        output_menu = self._lazy_menu("Output Mode", shell_menu, "output", self._build_output_menu)
         shell_menu.addMenu(output_menu)
         
         shell_menu.addSeparator()
@@ -209,7 +458,7 @@ class ShellWindow(QMainWindow):
         hotkey_menu = QMenu("Summon Hotkey", shell_menu)
         
         self.hotkey_enabled_action = QAction("Enable Hotkey", self, checkable=True)
-        self.hotkey_enabled_action.setChecked(True)
+        self.hotkey_enabled_action.setChecked(self.hotkey_enabled)
         self.hotkey_enabled_action.triggered.connect(self.toggle_hotkey)
         hotkey_menu.addAction(self.hotkey_enabled_action)
         
@@ -257,102 +506,23 @@ class ShellWindow(QMainWindow):
         permissions_menu = QMenu("Permissions", kernel_menu)
         
         # File System Access
-        fs_menu = QMenu("File System Access", permissions_menu)
-        
-        self.fs_none_action = QAction("None (Read-Only Config)", self, checkable=True)
-        self.fs_none_action.triggered.connect(lambda: self.set_filesystem_permission("none"))
-        fs_menu.addAction(self.fs_none_action)
-        
-        self.fs_scoped_action = QAction("Scoped (Selected Folders)", self, checkable=True)
-        self.fs_scoped_action.setChecked(True)
-        self.fs_scoped_action.triggered.connect(lambda: self.set_filesystem_permission("scoped"))
-        fs_menu.addAction(self.fs_scoped_action)
-        
-        self.fs_full_action = QAction("Full Access", self, checkable=True)
-        self.fs_full_action.triggered.connect(lambda: self.set_filesystem_permission("full"))
-        fs_menu.addAction(self.fs_full_action)
-        
-        fs_menu.addSeparator()
-        
-        manage_folders_action = QAction("Manage Allowed Folders...", self)
-        manage_folders_action.triggered.connect(self.manage_allowed_folders)
-        fs_menu.addAction(manage_folders_action)
-        
+        fs_menu = self._lazy_menu("File System Access", permissions_menu, "filesystem", self._build_fs_menu)
         permissions_menu.addMenu(fs_menu)
         
         # Network Access
-        network_menu = QMenu("Network Access", permissions_menu)
-        
-        self.net_none_action = QAction("Disabled", self, checkable=True)
-        self.net_none_action.triggered.connect(lambda: self.set_network_permission("none"))
-        network_menu.addAction(self.net_none_action)
-        
-        self.net_local_action = QAction("Local Only", self, checkable=True)
-        self.net_local_action.setChecked(True)
-        self.net_local_action.triggered.connect(lambda: self.set_network_permission("local"))
-        network_menu.addAction(self.net_local_action)
-        
-        self.net_full_action = QAction("Full Internet", self, checkable=True)
-        self.net_full_action.triggered.connect(lambda: self.set_network_permission("full"))
-        network_menu.addAction(self.net_full_action)
-        
+        network_menu = self._lazy_menu("Network Access", permissions_menu, "network", self._build_network_menu)
         permissions_menu.addMenu(network_menu)
         
         # System Information
-        sysinfo_menu = QMenu("System Information", permissions_menu)
-        
-        self.sysinfo_basic_action = QAction("Basic (CPU, Memory)", self, checkable=True)
-        self.sysinfo_basic_action.setChecked(True)
-        self.sysinfo_basic_action.triggered.connect(lambda: self.set_sysinfo_permission("basic"))
-        sysinfo_menu.addAction(self.sysinfo_basic_action)
-        
-        self.sysinfo_extended_action = QAction("Extended (+ Processes)", self, checkable=True)
-        self.sysinfo_extended_action.triggered.connect(lambda: self.set_sysinfo_permission("extended"))
-        sysinfo_menu.addAction(self.sysinfo_extended_action)
-        
-        self.sysinfo_full_action = QAction("Full (+ Hardware IDs)", self, checkable=True)
-        self.sysinfo_full_action.triggered.connect(lambda: self.set_sysinfo_permission("full"))
-        sysinfo_menu.addAction(self.sysinfo_full_action)
-        
+        sysinfo_menu = self._lazy_menu("System Information", permissions_menu, "sysinfo", self._build_sysinfo_menu)
         permissions_menu.addMenu(sysinfo_menu)
         
         # Calendar Access
-        calendar_menu = QMenu("Calendar Access", permissions_menu)
-        
-        self.cal_none_action = QAction("Disabled", self, checkable=True)
-        self.cal_none_action.triggered.connect(lambda: self.set_calendar_permission("none"))
-        calendar_menu.addAction(self.cal_none_action)
-        
-        self.cal_read_action = QAction("Read-Only", self, checkable=True)
-        self.cal_read_action.setChecked(True)
-        self.cal_read_action.triggered.connect(lambda: self.set_calendar_permission("read"))
-        calendar_menu.addAction(self.cal_read_action)
-        
-        self.cal_full_action = QAction("Read & Write", self, checkable=True)
-        self.cal_full_action.triggered.connect(lambda: self.set_calendar_permission("full"))
-        calendar_menu.addAction(self.cal_full_action)
-        
+        calendar_menu = self._lazy_menu("Calendar Access", permissions_menu, "calendar", self._build_calendar_menu)
         permissions_menu.addMenu(calendar_menu)
         
         # LLM Data Usage
-        llm_menu = QMenu("LLM Data Usage", permissions_menu)
-        
-        self.llm_local_action = QAction("Local Only (No External API)", self, checkable=True)
-        self.llm_local_action.setChecked(True)
-        self.llm_local_action.triggered.connect(lambda: self.set_llm_permission("local"))
-        llm_menu.addAction(self.llm_local_action)
-        
-        self.llm_external_action = QAction("Allow External API (Fallback)", self, checkable=True)
-        self.llm_external_action.triggered.connect(lambda: self.set_llm_permission("external"))
-        llm_menu.addAction(self.llm_external_action)
-        
-        llm_menu.addSeparator()
-        
-        self.llm_log_action = QAction("Log LLM Queries", self, checkable=True)
-        self.llm_log_action.setChecked(False)
-        self.llm_log_action.triggered.connect(self.toggle_llm_logging)
-        llm_menu.addAction(self.llm_log_action)
-        
+        llm_menu = self._lazy_menu("LLM Data Usage", permissions_menu, "llm", self._build_llm_menu)
         permissions_menu.addMenu(llm_menu)
         
         permissions_menu.addSeparator()
@@ -394,29 +564,144 @@ class ShellWindow(QMainWindow):
         
         # Store model transform values
         self.model_scale = 1.0
-        self.model_position = [0.0, 0.0, 0.0]
+        self.model_position = np.zeros(3, dtype=np.float32)
         
         # Store permission settings (default to secure)
-        self.permissions = {
-            "filesystem": "scoped",
-            "network": "local",
-            "sysinfo": "basic",
-            "calendar": "read",
-            "llm": "local",
-            "llm_logging": False,
-            "allowed_folders": []
-        }
+        self.permissions = {**_DEFAULT_PERMISSIONS, "allowed_folders": set()}
         
         self._load_permissions()
         
         self.tray_icon.show()
         logger.info("System tray icon created")
     
+    def _lazy_menu(self, title: str, parent: QMenu, name: str, builder) -> QMenu:
+        """Create an empty submenu that is populated by builder on first show"""
+        menu = QMenu(title, parent)
+        
+        def build():
+            if name in self._built_menus:
+                return
+            self._built_menus.add(name)
+            builder(menu)
+        
+        menu.aboutToShow.connect(build)
+        return menu
+    
+    def _build_input_menu(self, menu: QMenu):
+        """Populate the Input Mode submenu"""
+        text_action = QAction("Text", self, checkable=True)
+        text_action.triggered.connect(self._action_mapper.map)
+        self._action_mapper.setMapping(text_action, "input:text")
+        menu.addAction(text_action)
+        
+        voice_action = QAction("Voice (Coming Soon)", self, checkable=True)
+        voice_action.setEnabled(False)
+        voice_action.triggered.connect(self._action_mapper.map)
+        self._action_mapper.setMapping(voice_action, "input:voice")
+        menu.addAction(voice_action)
+        
+        self._input_mode_actions = {"text": text_action, "voice": voice_action}
+        for mode, action in self._input_mode_actions.items():
+            action.setChecked(self.input_mode == mode)
+    
+    def _build_output_menu(self, menu: QMenu):
+        """Populate the Output Mode submenu"""
+        text_action = QAction("Text", self, checkable=True)
+        text_action.triggered.connect(self._action_mapper.map)
+        self._action_mapper.setMapping(text_action, "output:text")
+        menu.addAction(text_action)
+        
+        voice_action = QAction("Voice (Coming Soon)", self, checkable=True)
+        voice_action.setEnabled(False)
+        voice_action.triggered.connect(self._action_mapper.map)
+        self._action_mapper.setMapping(voice_action, "output:voice")
+        menu.addAction(voice_action)
+        
+        self._output_mode_actions = {"text": text_action, "voice": voice_action}
+        for mode, action in self._output_mode_actions.items():
+            action.setChecked(self.output_mode == mode)
+    
+    @Slot(str)
+    def _dispatch_menu_action(self, key: str):
+        """Route a mapped "kind:value" action key to its setter"""
+        kind, value = key.split(":", 1)
+        if kind == "input":
+            self.set_input_mode(value)
+        elif kind == "output":
+            self.set_output_mode(value)
+        else:
+            self._apply_permission(kind, value)
+    
+    def _add_permission_actions(self, menu: QMenu, category: str, options):
+        """Add checkable (label, level) actions for a permission category"""
+        current = self.permissions[category]
+        for label, level in options:
+            action = QAction(label, self, checkable=True)
+            action.setChecked(current == level)
+            action.triggered.connect(self._action_mapper.map)
+            self._action_mapper.setMapping(action, f"{category}:{level}")
+            menu.addAction(action)
+            self._perm_actions.setdefault(category, {})[level] = action
+    
+    def _build_fs_menu(self, menu: QMenu):
+        """Populate the File System Access submenu"""
+        self._add_permission_actions(menu, "filesystem", [
+            ("None (Read-Only Config)", "none"),
+            ("Scoped (Selected Folders)", "scoped"),
+            ("Full Access", "full"),
+        ])
+        
+        menu.addSeparator()
+        
+        manage_folders_action = QAction("Manage Allowed Folders...", self)
+        manage_folders_action.triggered.connect(self.manage_allowed_folders)
+        menu.addAction(manage_folders_action)
+    
+    def _build_network_menu(self, menu: QMenu):
+        """Populate the Network Access submenu"""
+        self._add_permission_actions(menu, "network", [
+            ("Disabled", "none"),
+            ("Local Only", "local"),
+            ("Full Internet", "full"),
+        ])
+    
+    def _build_sysinfo_menu(self, menu: QMenu):
+        """Populate the System Information submenu"""
+        self._add_permission_actions(menu, "sysinfo", [
+            ("Basic (CPU, Memory)", "basic"),
+            ("Extended (+ Processes)", "extended"),
+            ("Full (+ Hardware IDs)", "full"),
+        ])
+    
+    def _build_calendar_menu(self, menu: QMenu):
+        """Populate the Calendar Access submenu"""
+        self._add_permission_actions(menu, "calendar", [
+            ("Disabled", "none"),
+            ("Read-Only", "read"),
+            ("Read & Write", "full"),
+        ])
+    
+    def _build_llm_menu(self, menu: QMenu):
+        """Populate the LLM Data Usage submenu"""
+        self._add_permission_actions(menu, "llm", [
+            ("Local Only (No External API)", "local"),
+            ("Allow External API (Fallback)", "external"),
+        ])
+        
+        menu.addSeparator()
+        
+        self.llm_log_action = QAction("Log LLM Queries", self, checkable=True)
+        self.llm_log_action.setChecked(self.permissions.get("llm_logging", False))
+        self.llm_log_action.triggered.connect(self.toggle_llm_logging)
+        menu.addAction(self.llm_log_action)
+    
+    @Slot(QSystemTrayIcon.ActivationReason)
     def tray_icon_activated(self, reason):
         """Handle tray icon activation"""
         if reason == QSystemTrayIcon.DoubleClick:
             self.toggle_visibility()
     
+    @Slot()
     def toggle_visibility(self):
         """Toggle window visibility"""
         if self.isVisible():
@@ -428,23 +713,81 @@ class ShellWindow(QMainWindow):
             self.show_hide_action.setText("Hide Shell")
             logger.info("Shell shown")
     
+    def _terminate_kernel_process(self) -> bool:
+        """Terminate the kernel directly by PID via Win32 (no taskkill fork)"""
+        if _kernel32 is None or not self.kernel_pid:
+            return False
+        
+        handle = _kernel32.OpenProcess(
+            PROCESS_TERMINATE | PROCESS_QUERY_LIMITED_INFORMATION, False, self.kernel_pid
+        )
+        if not handle:
+            self.kernel_pid = None
+            return False
+        try:
+            # The PID may have been reused since the pipe connected - only kill our kernel
+            size = ctypes.wintypes.DWORD(260)
+            image = ctypes.create_unicode_buffer(size.value)
+            if not _kernel32.QueryFullProcessImageNameW(handle, 0, image, ctypes.byref(size)):
+                self.kernel_pid = None
+                return False
+            if not image.value.lower().endswith("ev3kernel.exe"):
+                logger.warning(f"PID {self.kernel_pid} is no longer the kernel ({image.value})")
+                self.kernel_pid = None
+                return False
+            return bool(_kernel32.TerminateProcess(handle, 1))
+        finally:
+            _kernel32.CloseHandle(handle)
+    
+    @Slot()
     def stop_kernel(self):
         """Stop the kernel service"""
-        import subprocess
         try:
-            # Try to stop EV3Kernel.exe
-            subprocess.run(["taskkill", "/F", "/IM", "EV3Kernel.exe"], 
-                          capture_output=True)
-            self.tray_icon.showMessage(
-                "E.V3",
-                "Kernel stopped",
-                QSystemTrayIcon.Information,
-                2000
-            )
+            # Terminate by PID when known, fall back to taskkill by image name
+            if self._terminate_kernel_process():
+                self.kernel_pid = None
+                self._on_kernel_stopped(0)
+            else:
+                # Run taskkill asynchronously so the UI thread never waits on it
+                proc = QProcess(self)
+                proc.finished.connect(lambda exit_code, _status: self._on_kernel_stopped(exit_code))
+                proc.finished.connect(proc.deleteLater)
+                # finished is never emitted if taskkill can't be launched at all
+                proc.errorOccurred.connect(self._on_kernel_stop_error)
+                proc.start("taskkill", ["/F", "/IM", "EV3Kernel.exe"])
             logger.info("Kernel stop requested")
         except Exception as e:
             logger.error(f"Failed to stop kernel: {e}")
     
+    def _on_kernel_stopped(self, exit_code: int):
+        """Notify once the kernel stop has completed"""
+        # taskkill exits non-zero (e.g. 128) when no EV3Kernel.exe was running
+        if exit_code != 0:
+            logger.warning(f"Kernel stop failed (exit code {exit_code})")
+            self.tray_icon.showMessage(
+                "E.V3",
+                "Kernel was not running / could not be stopped",
+                QSystemTrayIcon.Warning,
+                3000
+            )
+            return
+        
+        logger.info("Kernel stopped")
+        self.tray_icon.showMessage(
+            "E.V3",
+            "Kernel stopped",
+            QSystemTrayIcon.Information,
+            2000
+        )
+    
+    @Slot(QProcess.ProcessError)
+    def _on_kernel_stop_error(self, error: QProcess.ProcessError):
+        """Report a taskkill process that failed to start"""
+        if error == QProcess.ProcessError.FailedToStart:
+            logger.error("Failed to stop kernel: taskkill could not be started")
+            self.sender().deleteLater()
+    
+    @Slot()
     def restart_kernel(self):
         """Restart the kernel service"""
         logger.info("Kernel restart requested")
@@ -458,66 +801,75 @@ class ShellWindow(QMainWindow):
     def zoom_in(self):
         """Zoom in on 3D model"""
         self.model_scale *= 1.1
-        if hasattr(self.renderer, 'set_model_scale'):
-            self.renderer.set_model_scale(self.model_scale)
+        self._schedule_xform(scale=True)
         logger.info(f"Model zoomed in: scale={self.model_scale:.2f}")
     
     def zoom_out(self):
         """Zoom out on 3D model"""
         self.model_scale *= 0.9
-        if hasattr(self.renderer, 'set_model_scale'):
-            self.renderer.set_model_scale(self.model_scale)
+        self._schedule_xform(scale=True)
         logger.info(f"Model zoomed out: scale={self.model_scale:.2f}")
     
     def reset_zoom(self):
         """Reset model zoom"""
         self.model_scale = 1.0
-        if hasattr(self.renderer, 'set_model_scale'):
-            self.renderer.set_model_scale(self.model_scale)
+        self._schedule_xform(scale=True)
         logger.info("Model zoom reset")
     
     def move_model_up(self):
         """Move model up"""
         self.model_position[1] += 0.1
-        if hasattr(self.renderer, 'set_model_position'):
-            self.renderer.set_model_position(*self.model_position)
+        self._schedule_xform(position=True)
         logger.info(f"Model moved up: position={self.model_position}")
     
     def move_model_down(self):
         """Move model down"""
         self.model_position[1] -= 0.1
-        if hasattr(self.renderer, 'set_model_position'):
-            self.renderer.set_model_position(*self.model_position)
+        self._schedule_xform(position=True)
         logger.info(f"Model moved down: position={self.model_position}")
     
     def move_model_left(self):
         """Move model left"""
         self.model_position[0] -= 0.1
-        if hasattr(self.renderer, 'set_model_position'):
-            self.renderer.set_model_position(*self.model_position)
+        self._schedule_xform(position=True)
         logger.info(f"Model moved left: position={self.model_position}")
     
     def move_model_right(self):
         """Move model right"""
         self.model_position[0] += 0.1
-        if hasattr(self.renderer, 'set_model_position'):
-            self.renderer.set_model_position(*self.model_position)
+        self._schedule_xform(position=True)
         logger.info(f"Model moved right: position={self.model_position}")
     
     def reset_position(self):
         """Reset model position"""
-        self.model_position = [0.0, 0.0, 0.0]
-        if hasattr(self.renderer, 'set_model_position'):
-            self.renderer.set_model_position(*self.model_position)
+        self.model_position.fill(0.0)
+        self._schedule_xform(position=True)
         logger.info("Model position reset")
     
+    def _schedule_xform(self, scale: bool = False, position: bool = False):
+        """Mark transform parts dirty and flush them on the next event loop pass"""
+        self._scale_dirty |= scale
+        self._position_dirty |= position
+        if not self._xform_timer.isActive():
+            self._xform_timer.start()
+    
+    @Slot()
+    def _flush_xform(self):
+        """Push the latest model scale/position to the renderer"""
+        if self._scale_dirty and self._set_scale is not None:
+            self._set_scale(self.model_scale)
+        if self._position_dirty and self._set_pos is not None:
+            self._set_pos(self.model_position)
+        self._scale_dirty = False
+        self._position_dirty = False
+    
     def set_input_mode(self, mode: str):
         """Set input mode (text or voice)"""
         self.input_mode = mode
         
         # Update checkmarks
-        self.input_text_action.setChecked(mode == "text")
-        self.input_voice_action.setChecked(mode == "voice")
+        for action_mode, action in self._input_mode_actions.items():
+            action.setChecked(action_mode == mode)
         
         logger.info(f"Input mode set to: {mode}")
         self.tray_icon.showMessage(
@@ -532,8 +884,8 @@ class ShellWindow(QMainWindow):
         self.output_mode = mode
         
         # Update checkmarks
-        self.output_text_action.setChecked(mode == "text")
-        self.output_voice_action.setChecked(mode == "voice")
+        for action_mode, action in self._output_mode_actions.items():
+            action.setChecked(action_mode == mode)
         
         logger.info(f"Output mode set to: {mode}")
         self.tray_icon.showMessage(
@@ -547,150 +899,109 @@ class ShellWindow(QMainWindow):
     
     def _load_permissions(self):
         """Load permissions from config file"""
-        import os
-        import yaml
-        
-        # Use writable config location (AppData on Windows, not bundled _internal)
-        config_dir = os.path.join(os.getenv('APPDATA', '.'), 'E.V3', 'config')
-        permissions_file = os.path.join(config_dir, "permissions.yaml")
-        
-        if os.path.exists(permissions_file):
-            try:
-                with open(permissions_file, 'r') as f:
-                    saved_perms = yaml.safe_load(f) or {}
-                    self.permissions.update(saved_perms)
-                logger.info(f"Permissions loaded from {permissions_file}")
-            except Exception as e:
-                logger.error(f"Failed to load permissions: {e}")
-        
-        # Update UI checkmarks based on loaded permissions
-        self._update_permission_checkmarks()
-    
-    def _save_permissions(self):
-        """Save permissions to config file"""
-        import os
-        import yaml
-        
-        # Use writable config location (AppData on Windows, not bundled _internal)
-        config_dir = os.path.join(os.getenv('APPDATA', '.'), 'E.V3', 'config')
-        os.makedirs(config_dir, exist_ok=True)
-        permissions_file = os.path.join(config_dir, "permissions.yaml")
-        
         try:
-            with open(permissions_file, 'w') as f:
-                yaml.dump(self.permissions, f, default_flow_style=False)
-            logger.info(f"Permissions saved to {permissions_file}")
+            with open(PERMISSIONS_FILE, 'r') as f:
+                saved_perms = yaml.load(f, Loader=YamlLoader) or {}
+                self.permissions.update(saved_perms)
+            # Held as a set in memory for O(1) membership checks
+            self.permissions["allowed_folders"] = set(self.permissions.get("allowed_folders") or ())
+            logger.info(f"Permissions loaded from {PERMISSIONS_FILE}")
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            logger.error(f"Failed to save permissions: {e}")
-    
-    def _update_permission_checkmarks(self):
-        """Update checkmarks in permission menus based on current settings"""
-        # Filesystem
-        self.fs_none_action.setChecked(self.permissions["filesystem"] == "none")
-        self.fs_scoped_action.setChecked(self.permissions["filesystem"] == "scoped")
-        self.fs_full_action.setChecked(self.permissions["filesystem"] == "full")
-        
-        # Network
-        self.net_none_action.setChecked(self.permissions["network"] == "none")
-        self.net_local_action.setChecked(self.permissions["network"] == "local")
-        self.net_full_action.setChecked(self.permissions["network"] == "full")
-        
-        # System Info
-        self.sysinfo_basic_action.setChecked(self.permissions["sysinfo"] == "basic")
-        self.sysinfo_extended_action.setChecked(self.permissions["sysinfo"] == "extended")
-        self.sysinfo_full_action.setChecked(self.permissions["sysinfo"] == "full")
-        
-        # Calendar
-        self.cal_none_action.setChecked(self.permissions["calendar"] == "none")
-        self.cal_read_action.setChecked(self.permissions["calendar"] == "read")
-        self.cal_full_action.setChecked(self.permissions["calendar"] == "full")
-        
-        # LLM
-        self.llm_local_action.setChecked(self.permissions["llm"] == "local")
-        self.llm_external_action.setChecked(self.permissions["llm"] == "external")
-        self.llm_log_action.setChecked(self.permissions.get("llm_logging", False))
-    
-    def set_filesystem_permission(self, level: str):
-        """Set filesystem access level"""
-        self.permissions["filesystem"] = level
-        self._update_permission_checkmarks()
-        self._save_permissions()
+            logger.error(f"Failed to load permissions: {e}")
         
-        logger.info(f"Filesystem permission set to: {level}")
-        self.tray_icon.showMessage(
-            "E.V3 Permissions",
-            f"File system access: {level}",
-            QSystemTrayIcon.Information,
-            2000
-        )
-        
-        # Notify kernel of permission change via IPC
-        self._notify_kernel_permissions()
-    
-    def set_network_permission(self, level: str):
-        """Set network access level"""
-        self.permissions["network"] = level
+        # Update UI checkmarks based on loaded permissions
         self._update_permission_checkmarks()
-        self._save_permissions()
-        
-        logger.info(f"Network permission set to: {level}")
-        self.tray_icon.showMessage(
-            "E.V3 Permissions",
-            f"Network access: {level}",
-            QSystemTrayIcon.Information,
-            2000
-        )
-        
-        self._notify_kernel_permissions()
     
-    def set_sysinfo_permission(self, level: str):
-        """Set system information access level"""
-        self.permissions["sysinfo"] = level
-        self._update_permission_checkmarks()
-        self._save_permissions()
-        
-        logger.info(f"System info permission set to: {level}")
-        self.tray_icon.showMessage(
-            "E.V3 Permissions",
-            f"System info access: {level}",
-            QSystemTrayIcon.Information,
-            2000
-        )
-        
-        self._notify_kernel_permissions()
+    def _permissions_snapshot(self) -> Dict[str, Any]:
+        """Copy of the current permissions, safe to hand to another thread"""
+        # Serialize folders sorted so the file diffs deterministically
+        return {**self.permissions, "allowed_folders": sorted(self.permissions["allowed_folders"])}
     
-    def set_calendar_permission(self, level: str):
-        """Set calendar access level"""
-        self.permissions["calendar"] = level
-        self._update_permission_checkmarks()
-        self._save_permissions()
-        
-        logger.info(f"Calendar permission set to: {level}")
-        self.tray_icon.showMessage(
-            "E.V3 Permissions",
-            f"Calendar access: {level}",
-            QSystemTrayIcon.Information,
-            2000
-        )
-        
-        self._notify_kernel_permissions()
-    
-    def set_llm_permission(self, level: str):
-        """Set LLM data usage permission"""
-        self.permissions["llm"] = level
-        self._update_permission_checkmarks()
+    def _save_permissions(self):
+        """Schedule a save and kernel notification; restarting the timer folds rapid changes into one"""
+        self._save_timer.start()
+    
+    @Slot()
+    def _save_permissions_now(self, background: bool = True):
+        """Save the current permissions and notify the kernel (write runs on a background thread)"""
+        self._save_timer.stop()
+        self._permissions_save_seq += 1
+        snapshot = self._permissions_snapshot()
+        # One IPC snapshot per burst of menu clicks, same as the disk write
+        self._notify_kernel_permissions(snapshot)
+        if background:
+            threading.Thread(
+                target=self._write_permissions,
+                args=(snapshot, self._permissions_save_seq),
+                daemon=True
+            ).start()
+        else:
+            self._write_permissions(snapshot, self._permissions_save_seq)
+    
+    def _flush_permissions(self):
+        """Write any unsaved permissions synchronously (daemon writers die at exit)"""
+        pending = self._save_timer.isActive()
+        # Taking the lock waits out a background write already in flight
+        with self._permissions_write_lock:
+            pending = pending or self._permissions_written_seq < self._permissions_save_seq
+        if pending:
+            self._save_permissions_now(background=False)
+    
+    def _write_permissions(self, snapshot: Dict[str, Any], seq: int):
+        """Write a permissions snapshot to disk (runs off the GUI thread)"""
+        with self._permissions_write_lock:
+            # A newer snapshot already reached disk - don't overwrite it with stale data
+            if seq < self._permissions_written_seq:
+                return
+            tmp_file = PERMISSIONS_FILE + ".tmp"
+            try:
+                os.makedirs(PERMISSIONS_DIR, exist_ok=True)
+                # Write aside and swap in, so a crash mid-write never truncates the file
+                with open(tmp_file, 'w') as f:
+                    yaml.dump(snapshot, f, Dumper=YamlDumper, default_flow_style=False)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, PERMISSIONS_FILE)
+                self._permissions_written_seq = seq
+                logger.info(f"Permissions saved to {PERMISSIONS_FILE}")
+            except Exception as e:
+                logger.error(f"Failed to save permissions: {e}")
+    
+    def _update_permission_checkmarks(self, key: Optional[str] = None):
+        """Update permission menu checkmarks (only those of key, if given)"""
+        permissions = self.permissions
+        categories = [key] if key is not None else list(self._perm_actions)
+        for category in categories:
+            current = permissions[category]
+            for level, action in self._perm_actions.get(category, {}).items():
+                # Skip no-op writes; triggered already flipped the clicked action itself
+                checked = current == level
+                if action.isChecked() != checked:
+                    action.setChecked(checked)
+        
+        if key is None and self.llm_log_action is not None:
+            logging_on = bool(permissions.get("llm_logging", False))
+            if self.llm_log_action.isChecked() != logging_on:
+                self.llm_log_action.setChecked(logging_on)
+    
+    def _apply_permission(self, key: str, value: str):
+        """Set one permission level, sync its checkmarks, persist and notify"""
+        self.permissions[key] = value
+        self._update_permission_checkmarks(key)
         self._save_permissions()
         
-        logger.info(f"LLM permission set to: {level}")
+        label = self._PERMISSION_LABELS[key]
+        logger.info(f"{label} set to: {value}")
         self.tray_icon.showMessage(
             "E.V3 Permissions",
-            f"LLM mode: {level}",
+            f"{label}: {value}",
             QSystemTrayIcon.Information,
             2000
         )
-        
-        self._notify_kernel_permissions()
     
+    @Slot()
     def toggle_llm_logging(self):
         """Toggle LLM query logging"""
         self.permissions["llm_logging"] = self.llm_log_action.isChecked()
@@ -704,13 +1015,10 @@ class ShellWindow(QMainWindow):
             QSystemTrayIcon.Information,
             2000
         )
-        
-        self._notify_kernel_permissions()
     
+    @Slot()
     def manage_allowed_folders(self):
         """Open dialog to manage allowed folders for scoped access"""
-        from PySide6.QtWidgets import QFileDialog, QMessageBox
-        
         dialog = QFileDialog(self)
         dialog.setFileMode(QFileDialog.Directory)
         dialog.setOption(QFileDialog.ShowDirsOnly, True)
@@ -720,7 +1028,7 @@ class ShellWindow(QMainWindow):
             if selected:
                 folder = selected[0]
                 if folder not in self.permissions["allowed_folders"]:
-                    self.permissions["allowed_folders"].append(folder)
+                    self.permissions["allowed_folders"].add(folder)
                     self._save_permissions()
                     
                     logger.info(f"Added allowed folder: {folder}")
@@ -730,8 +1038,6 @@ class ShellWindow(QMainWindow):
                         QSystemTrayIcon.Information,
                         2000
                     )
-                    
-                    self._notify_kernel_permissions()
                 else:
                     QMessageBox.information(
                         self,
@@ -741,7 +1047,7 @@ class ShellWindow(QMainWindow):
         
         # Show current allowed folders
         if self.permissions["allowed_folders"]:
-            folders_list = "\n".join(self.permissions["allowed_folders"])
+            folders_list = "\n".join(sorted(self.permissions["allowed_folders"]))
             QMessageBox.information(
                 self,
                 "Allowed Folders",
@@ -754,10 +1060,9 @@ class ShellWindow(QMainWindow):
                 "No folders currently allowed.\nSelect folders to grant access."
             )
     
+    @Slot()
     def reset_permissions(self):
         """Reset all permissions to secure defaults"""
-        from PySide6.QtWidgets import QMessageBox
-        
         reply = QMessageBox.question(
             self,
             "Reset Permissions",
@@ -767,15 +1072,7 @@ class ShellWindow(QMainWindow):
         )
         
         if reply == QMessageBox.Yes:
-            self.permissions = {
-                "filesystem": "scoped",
-                "network": "local",
-                "sysinfo": "basic",
-                "calendar": "read",
-                "llm": "local",
-                "llm_logging": False,
-                "allowed_folders": []
-            }
+            self.permissions = {**_DEFAULT_PERMISSIONS, "allowed_folders": set()}
             
             self._update_permission_checkmarks()
             self._save_permissions()
@@ -787,32 +1084,33 @@ class ShellWindow(QMainWindow):
                 QSystemTrayIcon.Information,
                 2000
             )
-            
-            self._notify_kernel_permissions()
     
-    def _notify_kernel_permissions(self):
+    def _notify_kernel_permissions(self, snapshot: Dict[str, Any]):
         """Notify kernel of permission changes via IPC"""
-        # This would send an IPC message to the kernel
-        # For now, just log it
+        # The kernel has no set_permissions handler yet - just log it
         logger.info("Kernel notified of permission changes")
-        # TODO: Implement IPC message sending when kernel connection is available
-        # Example: self.ipc_client.send_message("update_permissions", self.permissions)
+        # TODO: Send the snapshot once the kernel handles "set_permissions"
+        # Example: ipc_client.send_message("set_permissions", snapshot)
     
+    @Slot()
     def open_modules_window(self):
         """Open the Modules configuration window"""
         logger.info("Opening Modules window")
 
-        # Check if Modules window already exists
-        if not hasattr(self, 'core_window') or not self.core_window:
+        # Build once; closing only hides it (see ModulesWindow.closeEvent)
+        if self.core_window is None:
             self.core_window = ModulesWindow(self)
 
         self.core_window.show()
         self.core_window.raise_()
         self.core_window.activateWindow()
     
+    @Slot()
     def quit_application(self):
         """Quit the application"""
         logger.info("Quitting application")
+        self._unregister_global_hotkey()
+        self._flush_permissions()
         self.tray_icon.hide()
         QApplication.instance().quit()
     
@@ -830,25 +1128,47 @@ class ShellWindow(QMainWindow):
     
     def _position_window(self):
         """Position window at bottom-right above taskbar"""
-        ui_config = self.config.get("ui", {}).get("window", {})
-        
-        # Get screen geometry
-        screen = QScreen.availableGeometry(self.screen())
+        # Cached screen geometry (see _on_screen_geom_changed)
+        screen = self._screen_geom
         
         # Calculate position
-        offset_x = ui_config.get("offset_x", 20)
-        offset_y = ui_config.get("offset_y", 20)
-        
-        x = screen.right() - self.width() - offset_x
-        y = screen.bottom() - self.height() - offset_y
+        x = screen.right() - self.width() - self._offset_x
+        y = screen.bottom() - self.height() - self._offset_y
         
         self.move(x, y)
         logger.info(f"Window positioned at ({x}, {y})")
     
+    @Slot(QScreen)
+    def _track_screen(self, screen: QScreen):
+        """Cache a screen's available geometry and follow its future changes"""
+        if self._tracked_screen is not None:
+            self._tracked_screen.availableGeometryChanged.disconnect(self._on_screen_geom_changed)
+        self._tracked_screen = screen
+        self._screen_geom = screen.availableGeometry()
+        screen.availableGeometryChanged.connect(self._on_screen_geom_changed)
+    
+    @Slot(QRect)
+    def _on_screen_geom_changed(self, geometry):
+        """Update cached screen geometry and reposition once per event loop pass"""
+        self._screen_geom = geometry
+        if not self._reposition_scheduled:
+            self._reposition_scheduled = True
+            QTimer.singleShot(0, self._flush_reposition)
+    
+    @Slot()
+    def _flush_reposition(self):
+        """Apply a coalesced reposition after screen geometry changes"""
+        self._reposition_scheduled = False
+        self._position_window()
+    
+    @Slot()
     def _update_animations(self):
         """Update character animations"""
-        if hasattr(self, 'animation_controller'):
-            self.animation_controller.update(0.016)  # ~60 FPS
+        if not self._anim_running or not self._is_on_screen():
+            return
+        # Clamp so a stalled event loop doesn't make the animation jump
+        dt = min(self._anim_clock.restart() / 1000.0, 0.1)
+        self.animation_controller.update(dt)
     
     def set_state(self, state: str, message: str = "", priority: int = 0):
         """
@@ -859,7 +1179,7 @@ class ShellWindow(QMainWindow):
         self.current_state = state
         
         # Update animation state
-        if hasattr(self, 'animation_controller'):
+        if self.animation_controller is not None:
             self.animation_controller.set_state(state)
         
         # Update message
@@ -869,12 +1189,26 @@ class ShellWindow(QMainWindow):
             self.hide_message()
         
         # Update click-through based on state
-        if state in ["alert", "reminder"]:
-            self.enable_interaction()
+        if state in ("alert", "reminder"):
+            desired_click_through = False
+        elif self._click_through_when_idle:
+            desired_click_through = True
         else:
-            click_through = self.config.get("ui", {}).get("window", {}).get("click_through_when_idle", True)
-            if click_through:
-                self.disable_interaction()
+            desired_click_through = self.is_click_through
+        self._request_click_through(desired_click_through)
+        
+        # Idle click-through with nothing animating needs no ticks or repaints
+        if self.animation_controller is not None:
+            self._at_rest = at_rest = (
+                state == "idle"
+                and desired_click_through
+                and not self.renderer.idle_animation_enabled
+                and not self.animation_controller.is_animating()
+            )
+            if at_rest:
+                self._stop_animation()
+            elif self._is_on_screen():
+                self._start_animation()
         
         # Apply visual effects
         self._apply_state_effects(state, priority)
@@ -883,35 +1217,48 @@ class ShellWindow(QMainWindow):
     
     def _apply_state_effects(self, state: str, priority: int):
         """Apply visual effects based on state"""
-        if state == "alert":
-            # Glow effect for alerts
-            glow_config = self.config.get("ui", {}).get("animations", {}).get("glow", {})
-            if glow_config.get("enabled", True):
-                color = glow_config.get("color", [0.3, 0.6, 1.0])
-                intensity = glow_config.get("intensity", 0.5)
-                
-                # Higher priority = more intense glow
-                intensity *= (priority + 1) * 0.3
-                
-                self.renderer.apply_glow_effect(intensity, tuple(color))
+        effect = self._state_effects.get(state)
+        if effect is None:
+            return
         
-        elif state == "reminder":
-            # Gentle glow for reminders
-            self.renderer.apply_glow_effect(0.3, (0.5, 0.8, 0.3))
+        base, color, priority_scale = effect
+        # Higher priority = more intense glow (alerts); reminders glow gently at a fixed level
+        intensity = base * (priority + 1) * priority_scale if priority_scale else base
+        self._apply_glow(state, intensity, color)
+    
+    def _apply_glow(self, state: str, intensity: float, color: tuple):
+        """Apply glow via the renderer, skipping it when already applied"""
+        key = (state, round(intensity, 3), color)
+        if key == self._last_glow:
+            return
+        self._last_glow = key
+        self.renderer.apply_glow_effect(intensity, color)
     
     def show_message(self, message: str):
         """Show text message"""
-        self.message_label.setText(message)
-        self.message_label.show()
+        label = self.message_label
+        label.setText(message)
+        # The window is fixed-size, so only the wrapped text height varies
+        width = self._window_width
+        height = label.heightForWidth(width)
+        label.setGeometry(0, self._window_height - height, width, height)
+        label.raise_()
+        label.show()
         
         # Auto-hide after some time (for non-critical messages)
         if self.current_state not in ["alert", "reminder"]:
-            QTimer.singleShot(5000, self.hide_message)
+            self._msg_hide_timer.start(5000)  # Restarts if already running
+        else:
+            self._msg_hide_timer.stop()
     
+    @Slot()
     def hide_message(self):
         """Hide text message"""
-        self.message_label.hide()
+        self._msg_hide_timer.stop()
+        if not self.message_label.isHidden():
+            self.message_label.hide()
     
+    @Slot()
     def toggle_manipulate_mode(self):
         """Toggle model manipulation mode"""
         self.manipulate_mode = not self.manipulate_mode
@@ -919,9 +1266,7 @@ class ShellWindow(QMainWindow):
         
         if self.manipulate_mode:
             # Disable click-through to allow interaction
-            flags = self.windowFlags()
-            flags &= ~Qt.WindowTransparentForInput
-            self.setWindowFlags(flags)
+            self._set_input_transparent(False)
             self.show()
             logger.info("Manipulate mode enabled - use mouse to rotate/pan/zoom model")
             self.tray_icon.showMessage(
@@ -932,30 +1277,59 @@ class ShellWindow(QMainWindow):
             )
         else:
             # Re-enable click-through
-            flags = self.windowFlags()
-            flags |= Qt.WindowTransparentForInput
-            self.setWindowFlags(flags)
-            self.show()
+            self._set_input_transparent(True)
             logger.info("Manipulate mode disabled")
     
+    def _request_click_through(self, enabled: bool):
+        """
+        Schedule a click-through change for the next event loop pass
+        
+        Rapid state flips (idle -> alert -> idle) collapse into the final
+        value, so the window flags are only rebuilt when they really change.
+        """
+        if self._pending_click_through is None:
+            if enabled == self.is_click_through:
+                return
+            QTimer.singleShot(0, self._apply_pending_click_through)
+        self._pending_click_through = enabled
+    
+    @Slot()
+    def _apply_pending_click_through(self):
+        """Apply the coalesced click-through change"""
+        enabled, self._pending_click_through = self._pending_click_through, None
+        if enabled:
+            self.disable_interaction()
+        else:
+            self.enable_interaction()
+    
+    def _set_input_transparent(self, transparent: bool):
+        """Toggle WindowTransparentForInput without re-creating the native window"""
+        flags = self._click_through_flags if transparent else self._interactive_flags
+        handle = self.windowHandle()
+        if handle is None:
+            # Native window not created yet - plain flag update is cheap
+            was_visible = self.isVisible()
+            self.setWindowFlags(flags)
+            if was_visible:
+                self.show()  # setWindowFlags() hides the widget
+            return
+        
+        # QWidget.setWindowFlags() re-creates and hides the window; QWindow applies flags in place
+        self.overrideWindowFlags(flags)
+        handle.setFlags(flags)
+    
     def enable_interaction(self):
         """Enable window interaction (disable click-through)"""
         if self.is_click_through:
             self.is_click_through = False
-            flags = self.windowFlags()
-            flags &= ~Qt.WindowTransparentForInput
-            self.setWindowFlags(flags)
-            self.show()  # Need to show again after changing flags
+            self._set_input_transparent(False)
             logger.debug("Interaction enabled")
     
     def disable_interaction(self):
         """Disable interaction (enable click-through)"""
         if not self.is_click_through:
             self.is_click_through = True
-            flags = self.windowFlags()
-            flags |= Qt.WindowTransparentForInput
-            self.setWindowFlags(flags)
-            self.show()
+            self._set_input_transparent(True)
             logger.debug("Click-through enabled")
     
     def mousePressEvent(self, event):
@@ -965,7 +1339,9 @@ class ShellWindow(QMainWindow):
             self.renderer.mousePressEvent(event)
             event.accept()
         elif event.button() == Qt.LeftButton and not self.is_click_through and not self.window_locked:
-            self.drag_position = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
+            # Plain int offsets - top-level pos() is the frame's top-left
+            gp = event.globalPosition()
+            self.drag_position = (int(gp.x()) - self.x(), int(gp.y()) - self.y())
             event.accept()
     
     def mouseMoveEvent(self, event):
@@ -974,10 +1350,31 @@ class ShellWindow(QMainWindow):
             # Forward to renderer for model manipulation
             self.renderer.mouseMoveEvent(event)
             event.accept()
-        elif event.buttons() == Qt.LeftButton and not self.is_click_through and not self.window_locked:
-            if hasattr(self, 'drag_position'):
-                self.move(event.globalPosition().toPoint() - self.drag_position)
-                event.accept()
+        elif self.drag_position is not None and event.buttons() == Qt.LeftButton:
+            # Press already checked click-through/lock; only a live drag gets here
+            gp = event.globalPosition()
+            dx, dy = self.drag_position
+            self._pending_move = (int(gp.x()) - dx, int(gp.y()) - dy)
+            if not self._move_scheduled:
+                self._move_scheduled = True
+                QTimer.singleShot(0, self._flush_move)
+            event.accept()
+    
+    def mouseReleaseEvent(self, event):
+        """End a window drag or forward the release in manipulate mode"""
+        if self.manipulate_mode:
+            self.renderer.mouseReleaseEvent(event)
+            event.accept()
+        elif event.button() == Qt.LeftButton:
+            self.drag_position = None
+    
+    @Slot()
+    def _flush_move(self):
+        """Apply the latest pending drag position (coalesces bursts of move events)"""
+        self._move_scheduled = False
+        pos, self._pending_move = self._pending_move, None
+        if pos is not None:
+            self.move(*pos)
     
     def wheelEvent(self, event):
         """Handle mouse wheel (zoom in manipulate mode)"""
@@ -994,26 +1391,65 @@ class ShellWindow(QMainWindow):
                 # Notify service (would send IPC message)
                 logger.info("Notification dismissed by user")
     
+    @Slot()
     def _setup_global_hotkey(self):
-        """Setup global keyboard shortcut to summon character and chat"""
+        """Register the summon hotkey at startup if it's enabled"""
+        if self.hotkey_enabled:
+            self._register_global_hotkey()
+    
+    def _register_global_hotkey(self) -> bool:
+        """Register the global keyboard shortcut to summon character and chat"""
+        if self._hotkey_filter is not None:
+            return True
+        if sys.platform != "win32":
+            logger.warning("Global hotkey is only supported on Windows")
+            return False
+        
         try:
-            keyboard.add_hotkey(self.hotkey_combination, self._on_hotkey_pressed)
-            logger.info(f"Global hotkey registered: {self.hotkey_combination}")
+            # Parse the combination once; Windows then posts one WM_HOTKEY per press
+            modifiers, vk = parse_hotkey(self.hotkey_combination)
+            
+            # hWnd=NULL: delivered to this (GUI) thread's queue, independent of the window handle
+            if not ctypes.windll.user32.RegisterHotKey(None, HOTKEY_ID, modifiers, vk):
+                raise ctypes.WinError()
         except Exception as e:
-            logger.error(f"Failed to register global hotkey: {e}")
+            logger.error(f"Failed to register global hotkey {self.hotkey_combination}: {e}")
+            self.tray_icon.showMessage(
+                "E.V3",
+                f"Summon hotkey {self.hotkey_combination.upper()} is unavailable "
+                f"(in use or invalid). Set ui.hotkey.combination in config.yaml.",
+                QSystemTrayIcon.Warning,
+                5000
+            )
+            return False
+        
+        # Only listen for WM_HOTKEY once the registration actually holds
+        self._hotkey_filter = _HotkeyEventFilter(self._on_hotkey_pressed)
+        QApplication.instance().installNativeEventFilter(self._hotkey_filter)
+        logger.info(f"Global hotkey registered: {self.hotkey_combination}")
+        return True
+    
+    def _unregister_global_hotkey(self):
+        """Release the global hotkey"""
+        if self._hotkey_filter is not None:
+            ctypes.windll.user32.UnregisterHotKey(None, HOTKEY_ID)
+            QApplication.instance().removeNativeEventFilter(self._hotkey_filter)
+            self._hotkey_filter = None
+            logger.info("Global hotkey unregistered")
     
     def _on_hotkey_pressed(self):
         """Handle hotkey press - emit signal to run on GUI thread"""
-        if not self.hotkey_enabled:
-            return
-        
-        logger.info("Hotkey pressed - summoning character and chat")
-        
         # Emit signal to handle on GUI thread (thread-safe)
         self.hotkey_triggered.emit()
     
+    @Slot()
     def _handle_hotkey_on_gui_thread(self):
         """Handle hotkey actions on the GUI thread (called via signal)"""
+        if not self.hotkey_enabled:
+            return
+        
+        logger.info("Hotkey pressed - summoning character and chat")
+        
         # Show window if hidden
         if not self.isVisible():
             self.show()
@@ -1025,18 +1461,31 @@ class ShellWindow(QMainWindow):
         # Open chat window
         self.open_chat_window()
     
+    @Slot(bool)
     def toggle_hotkey(self, checked: bool):
         """Toggle hotkey enabled/disabled"""
+        if checked and not self._register_global_hotkey():
+            # Registration failed (already reported) - reflect that in the menu
+            checked = False
+            self.hotkey_enabled_action.setChecked(False)
+        elif not checked:
+            self._unregister_global_hotkey()
         self.hotkey_enabled = checked
         logger.info(f"Hotkey {'enabled' if checked else 'disabled'}")
     
-    def open_chat_window(self):
-        """Open the chat input window"""
+    @Slot()
+    def _prewarm_chat(self):
+        """Build the chat window if it doesn't exist yet (also run once shortly after startup)"""
         if self.chat_window is None:
             self.chat_window = ChatWindow(self)
             # Connect the message_sent signal directly to the send method
             # This will be properly routed by main_ui.py
             self.chat_window.message_sent.connect(self.send_chat_message)
+    
+    @Slot()
+    def open_chat_window(self):
+        """Open the chat input window"""
+        self._prewarm_chat()
         
         # Position chat window next to character
         chat_pos = self.pos()
@@ -1049,11 +1498,11 @@ class ShellWindow(QMainWindow):
         self.chat_window.activateWindow()
         
         # Use timer to ensure focus after window is fully shown
-        from PySide6.QtCore import QTimer
-        QTimer.singleShot(100, lambda: self._set_chat_focus())
+        QTimer.singleShot(100, self._set_chat_focus)
         
         logger.info("Chat window opened")
     
+    @Slot()
     def _set_chat_focus(self):
         """Set focus to chat window - called after short delay"""
         try:
@@ -1090,20 +1539,20 @@ class ShellWindow(QMainWindow):
         except Exception as e:
             logger.error(f"Error setting focus: {e}", exc_info=True)
     
+    @Slot(str)
     def send_chat_message(self, message: str):
         """Send chat message to kernel via IPC"""
         logger.info(f"send_chat_message called with: {message[:50]}...")
         
         # Check if we have access to the parent app's IPC client
         # The main_ui.py EV3UIApplication will have hooked into this
-        if hasattr(self, '_ipc_send_callback'):
+        if self._ipc_send_callback is not None:
             self._ipc_send_callback(message)
         else:
             logger.warning("No IPC callback available - chat message will not be sent")
     
     def display_chat_response(self, response: str):
         """Display LLM response in chat window"""
-        from loguru import logger
         logger.info(f"display_chat_response called, chat_window exists: {self.chat_window is not None}")
         if self.chat_window:
             logger.info(f"Chat window visible: {self.chat_window.isVisible()}")
@@ -1119,6 +1568,82 @@ class ShellWindow(QMainWindow):
             logger.warning("No chat_window to display response")
 
 
+# Chat window stylesheets (built once at import, shared by every ChatWindow)
+_CHAT_STYLESHEET = """
+    QDialog {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #2b2b2b, stop:1 #1a1a1a);
+        border: 2px solid #3a7bd5;
+        border-radius: 10px;
+    }
+    QLabel {
+        color: #ffffff;
+        font-size: 13px;
+        padding: 5px;
+    }
+    QLineEdit {
+        background: #3a3a3a;
+        color: #ffffff;
+        border: 2px solid #555555;
+        border-radius: 5px;
+        padding: 8px;
+        font-size: 13px;
+    }
+    QLineEdit:focus {
+        border: 2px solid #3a7bd5;
+    }
+    QPushButton {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #3a7bd5, stop:1 #2563a8);
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 10px;
+        font-size: 13px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #4a8be5, stop:1 #3573b8);
+    }
+    QPushButton:pressed {
+        background: #2563a8;
+    }
+    QFrame {
+        background: #2a2a2a;
+        border: 1px solid #444444;
+        border-radius: 5px;
+    }
+"""
+
+_CHAT_HISTORY_STYLESHEET = """
+    QTextEdit {
+        background: #2a2a2a;
+        border: 1px solid #444444;
+        border-radius: 5px;
+        padding: 10px;
+        color: #e0e0e0;
+        font-size: 12px;
+    }
+    QScrollBar:vertical {
+        background: #2a2a2a;
+        width: 12px;
+        border-radius: 6px;
+    }
+    QScrollBar::handle:vertical {
+        background: #3a7bd5;
+        border-radius: 6px;
+        min-height: 20px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background: #4a8be5;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+"""
+
+
 class ChatWindow(QDialog):
     """
     Floating chat window for user input and LLM responses
@@ -1140,52 +1665,7 @@ class ChatWindow(QDialog):
         )
         
         self.setFixedSize(400, 500)
-        self.setStyleSheet("""
-            QDialog {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #2b2b2b, stop:1 #1a1a1a);
-                border: 2px solid #3a7bd5;
-                border-radius: 10px;
-            }
-            QLabel {
-                color: #ffffff;
-                font-size: 13px;
-                padding: 5px;
-            }
-            QLineEdit {
-                background: #3a3a3a;
-                color: #ffffff;
-                border: 2px solid #555555;
-                border-radius: 5px;
-                padding: 8px;
-                font-size: 13px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #3a7bd5;
-            }
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #3a7bd5, stop:1 #2563a8);
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 10px;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4a8be5, stop:1 #3573b8);
-            }
-            QPushButton:pressed {
-                background: #2563a8;
-            }
-            QFrame {
-                background: #2a2a2a;
-                border: 1px solid #444444;
-                border-radius: 5px;
-            }
-        """)
+        self.setStyleSheet(_CHAT_STYLESHEET)
         
         self._create_ui()
     
@@ -1201,38 +1681,14 @@ class ChatWindow(QDialog):
         layout.addWidget(title)
         
         # Chat history display with scroll support
-        from PySide6.QtWidgets import QTextEdit
         self.chat_history = QTextEdit()
         self.chat_history.setReadOnly(True)
         self.chat_history.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.chat_history.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.chat_history.setFixedHeight(320)
-        self.chat_history.setStyleSheet("""
-            QTextEdit {
-                background: #2a2a2a;
-                border: 1px solid #444444;
-                border-radius: 5px;
-                padding: 10px;
-                color: #e0e0e0;
-                font-size: 12px;
-            }
-            QScrollBar:vertical {
-                background: #2a2a2a;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background: #3a7bd5;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #4a8be5;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
+        # Keep last 10 messages - Qt drops the oldest blocks as new ones are appended
+        self.chat_history.document().setMaximumBlockCount(10)
+        self.chat_history.setStyleSheet(_CHAT_HISTORY_STYLESHEET)
         layout.addWidget(self.chat_history)
         
         # Input field
@@ -1245,7 +1701,6 @@ class ChatWindow(QDialog):
         send_button = QPushButton("Send")
         send_button.clicked.connect(self._on_send_clicked)
         layout.addWidget(send_button)
-        layout.addWidget(send_button)
         
         # Info label
         info_label = QLabel("💡 Tip: Press Enter to send, close button (X) to hide chat window")
@@ -1253,14 +1708,16 @@ class ChatWindow(QDialog):
         info_label.setWordWrap(True)
         layout.addWidget(info_label)
         
-        self.chat_messages = []
+        self._thinking_shown = False
     
+    @Slot()
     def _on_send_clicked(self):
         """Handle Send button click - separate from Enter key"""
         # Only send if input field is not already processing
         if self.input_field.text().strip():
             self._send_message()
     
+    @Slot()
     def _send_message(self):
         """Send message from input field"""
         message = self.input_field.text().strip()
@@ -1269,8 +1726,7 @@ class ChatWindow(QDialog):
             return
         
         # Add to history
-        self.chat_messages.append(f"<b>You:</b> {message}")
-        self._update_history()
+        self._append_history(f"<b>You:</b> {message}")
         
         # Emit signal
         self.message_sent.emit(message)
@@ -1279,39 +1735,38 @@ class ChatWindow(QDialog):
         self.input_field.clear()
         
         # Add "thinking" indicator
-        self.chat_messages.append("<i style='color: #3a7bd5;'>E.V3 is thinking...</i>")
-        self._update_history()
+        self._append_history("<i style='color: #3a7bd5;'>E.V3 is thinking...</i>")
+        self._thinking_shown = True
     
     def display_response(self, response: str):
         """Display LLM response"""
-        from loguru import logger
         logger.info(f"ChatWindow.display_response called with response length: {len(response)}")
-        logger.info(f"Current chat_messages count: {len(self.chat_messages)}")
         
-        # Remove "thinking" indicator
-        if self.chat_messages and "thinking" in self.chat_messages[-1]:
+        # Remove "thinking" indicator (always the last block)
+        if self._thinking_shown:
             logger.info("Removing 'thinking' indicator")
-            self.chat_messages.pop()
+            cursor = self.chat_history.textCursor()
+            cursor.movePosition(QTextCursor.End)
+            cursor.select(QTextCursor.BlockUnderCursor)
+            cursor.removeSelectedText()
+            self._thinking_shown = False
         
         # Add response
-        self.chat_messages.append(f"<b style='color: #3a7bd5;'>E.V3:</b> {response}")
-        logger.info("Response added to chat_messages, calling _update_history")
-        self._update_history()
-        logger.info("_update_history completed")
+        self._append_history(f"<b style='color: #3a7bd5;'>E.V3:</b> {response}")
+        logger.info("Response appended to chat history")
     
-    def _update_history(self):
-        """Update chat history display"""
-        # Keep last 10 messages
-        if len(self.chat_messages) > 10:
-            self.chat_messages = self.chat_messages[-10:]
-        
-        history_text = "<br><br>".join(self.chat_messages)
-        self.chat_history.setHtml(history_text)
+    def _append_history(self, html: str):
+        """Append one message to the chat history (only the new block is laid out)"""
+        self.chat_history.append(html)
         
-        # Auto-scroll to bottom
-        from PySide6.QtGui import QTextCursor
+        # Blank line between messages (what the old <br><br> separators gave)
         cursor = self.chat_history.textCursor()
         cursor.movePosition(QTextCursor.End)
+        spacing = QTextBlockFormat()
+        spacing.setBottomMargin(self.chat_history.fontMetrics().lineSpacing())
+        cursor.mergeBlockFormat(spacing)
+        
+        # Auto-scroll to bottom
         self.chat_history.setTextCursor(cursor)
         self.chat_history.ensureCursorVisible()
     
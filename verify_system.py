@@ -4,19 +4,50 @@ E.V3 System Verification Script
 Validates all components are present and functional
 """
 
+import os
 import sys
 import subprocess
+import importlib.util
 from pathlib import Path
 import json
 
-def check(description: str, condition: bool, details: str = "") -> bool:
-    """Print check result"""
+# Kernel ping request, encoded once
+PING_REQUEST = json.dumps({'command': 'ping'}).encode('utf-8')
+
+def check(description: str, condition: bool, details: str = "", fatal: bool = False) -> bool:
+    """Print check result (a failed fatal check ends the verification)"""
     status = "✓" if condition else "✗"
-    print(f"{status} {description}")
+    # One write per check, so a line-buffered console flushes once
     if details:
-        print(f"  {details}")
+        print(f"{status} {description}\n  {details}")
+    else:
+        print(f"{status} {description}")
+    if fatal and not condition:
+        print("\n✗ FATAL - remaining checks skipped, fix this first")
+        raise SystemExit(1)
     return condition
 
+# Directory listings, read once per parent so each existence check is a set lookup
+_listings = {}
+
+def exists(path: Path) -> bool:
+    """Check a path via a cached os.scandir of its parent directory"""
+    parent = path.parent
+    names = _listings.get(parent)
+    if names is None:
+        try:
+            with os.scandir(parent) as entries:
+                names = frozenset(os.path.normcase(entry.name) for entry in entries)
+        except OSError:
+            # Missing (or unreadable) parent - nothing below it exists for our purposes
+            names = frozenset()
+        _listings[parent] = names
+    return os.path.normcase(path.name) in names
+
+def importable(module: str) -> bool:
+    """Whether a module can be imported, without executing it"""
+    return module in sys.modules or importlib.util.find_spec(module) is not None
+
 def main():
     """Run all verification checks"""
     print("="*70)
@@ -32,7 +63,8 @@ def main():
     all_ok &= check(
         "Python version 3.10+",
         sys.version_info >= (3, 10),
-        f"Current: Python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+        f"Current: Python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+        fatal=True
     )
     
     # 2. Required files
@@ -50,7 +82,7 @@ def main():
     for name, path in required_files:
         all_ok &= check(
             f"{name}",
-            path.exists(),
+            exists(path),
             f"Path: {path}"
         )
     
@@ -58,17 +90,17 @@ def main():
     print("\n3. Python Dependencies")
     print("-" * 70)
     
+    # (pip package, module it provides, purpose)
     packages = [
-        ("pywin32", "Windows Named Pipes"),
-        ("pyyaml", "YAML configuration"),
-        ("loguru", "Logging"),
+        ("pywin32", "win32file", "Windows Named Pipes"),
+        ("pyyaml", "yaml", "YAML configuration"),
+        ("loguru", "loguru", "Logging"),
     ]
     
-    for package, purpose in packages:
-        try:
-            __import__(package)
+    for package, module, purpose in packages:
+        if importable(module):
             all_ok &= check(f"{package}", True, f"Purpose: {purpose}")
-        except ImportError:
+        else:
             all_ok &= check(f"{package}", False, f"Purpose: {purpose} [INSTALL: pip install {package}]")
     
     # 4. Optional packages
@@ -77,12 +109,19 @@ def main():
     
     optional = ["llama_cpp", "psutil"]
     for package in optional:
-        try:
-            __import__(package)
+        if importable(package):
             print(f"✓ {package} (available)")
-        except ImportError:
+        else:
             print(f"○ {package} (optional, for: pip install {package.replace('_', '-')}-python)")
     
+    # Config files load through yaml.CSafeLoader when PyYAML was built against libyaml
+    if importable("yaml"):
+        import yaml
+        if hasattr(yaml, "CSafeLoader"):
+            print("✓ libyaml (fast config loading)")
+        else:
+            print("○ libyaml (optional, pure-Python YAML fallback in use)")
+    
     # 5. Directory structure
     print("\n5. Directory Structure")
     print("-" * 70)
@@ -94,8 +133,7 @@ def main():
     ]
     
     for name, path in dirs:
-        exists = path.exists()
-        if not exists:
+        if not exists(path):
             path.mkdir(parents=True, exist_ok=True)
         all_ok &= check(f"{name}", True, f"Path: {path}")
     
@@ -109,14 +147,16 @@ def main():
     ]
     
     for name, path in config_files:
-        all_ok &= check(f"{name}", path.exists(), f"Path: {path}")
+        all_ok &= check(f"{name}", exists(path), f"Path: {path}")
     
     # 7. Quick kernel test
     print("\n7. Kernel Connectivity Test")
     print("-" * 70)
     
     try:
+        import win32event
         import win32file
+        import win32pipe
         import pywintypes
         
         pipe_name = r'\\.\pipe\E.V3.v2'
@@ -124,17 +164,31 @@ def main():
             handle = win32file.CreateFile(
                 pipe_name,
                 win32file.GENERIC_READ | win32file.GENERIC_WRITE,
-                0, None, win32file.OPEN_EXISTING, 0, None
+                0, None, win32file.OPEN_EXISTING, win32file.FILE_FLAG_OVERLAPPED, None
             )
             
-            # Test ping
-            message = json.dumps({'command': 'ping'})
-            win32file.WriteFile(handle, message.encode('utf-8'))
-            hr, data = win32file.ReadFile(handle, 1024)
-            response = json.loads(data.decode('utf-8'))
-            
-            all_ok &= check("Kernel accessible via IPC", response.get('response') == 'pong')
-            win32file.CloseHandle(handle)
+            overlapped = pywintypes.OVERLAPPED()
+            try:
+                # The kernel's pipe is message-mode; read it that way so the
+                # ping can be written and answered in a single transaction
+                win32pipe.SetNamedPipeHandleState(handle, win32pipe.PIPE_READMODE_MESSAGE, None, None)
+                
+                # Test ping - overlapped, so a hung kernel can't stall the verification
+                overlapped.hEvent = win32event.CreateEvent(None, True, False, None)
+                buffer = win32file.AllocateReadBuffer(1024)
+                win32pipe.TransactNamedPipe(handle, PING_REQUEST, buffer, overlapped)
+                
+                if win32event.WaitForSingleObject(overlapped.hEvent, 2000) == win32event.WAIT_OBJECT_0:
+                    size = win32file.GetOverlappedResult(handle, overlapped, False)
+                    response = json.loads(bytes(buffer[:size]))
+                    all_ok &= check("Kernel accessible via IPC", response.get('response') == 'pong')
+                else:
+                    win32file.CancelIo(handle)
+                    all_ok &= check("Kernel accessible via IPC", False, "No reply to ping within 2s - kernel unresponsive")
+            finally:
+                if overlapped.hEvent:
+                    win32file.CloseHandle(overlapped.hEvent)
+                win32file.CloseHandle(handle)
             
         except pywintypes.error:
             print("○ Kernel not currently running (this is normal, start it with: kernel_cpp\\build\\Release\\EV3Kernel.exe)")